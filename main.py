@@ -1,36 +1,44 @@
 import argparse
 import logging
+import os
 import re
 import sys
 import threading
 from collections.abc import Iterator
-from itertools import chain, islice
+from itertools import islice
 from pathlib import Path
-
-# Add src to path if running from root
-sys.path.append(".")
-
-# Configure logging
-import os
+from typing import Any, TypeVar
 
 from src.core.config import UIConfig, get_settings
-from src.core.graph import create_app
-from src.core.simulation import create_simulation_graph
-from src.data.rag import RAG
+from src.core.constants import ERR_RAG_TEXT_TOO_LARGE
 from src.domain_models.lean_canvas import LeanCanvas
 from src.domain_models.state import GlobalState, Phase
-from src.ui.renderer import SimulationRenderer
 
+# Configure logging
 logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # We instantiate settings lazily inside main() or explicitly when needed
 # to avoid side-effects during test collection where main.py is imported
 
+# Page rendering constants, built once at import instead of per idea
+_SEPARATOR = "-" * 50
+_IDEA_TEMPLATE = (
+    "\n[{0.id}] {0.title}\n    Problem: {0.problem}\n    Solution: {0.solution}\n" + _SEPARATOR
+)
+
+
+def _prepend(first: T, rest: Iterator[T]) -> Iterator[T]:
+    """Yield a peeked item followed by the rest of its iterator."""
+    yield first
+    yield from rest
+
 
 def echo(msg: str) -> None:
-    """Print message to stdout."""
-    print(msg)  # noqa: T201
+    """Write message to stdout in a single write call."""
+    sys.stdout.write(f"{msg}\n")
 
 
 def safe_input(prompt: str) -> str:
@@ -56,14 +64,18 @@ def validate_topic(topic: str) -> str:
     Sanitize and validate the topic string.
     Allow alphanumeric, spaces, and basic punctuation.
     """
-    if not topic or not topic.strip():
-        msg = "Topic cannot be empty."
-        raise ValueError(msg)
+    empty_msg = "Topic cannot be empty."
+    if not topic:
+        raise ValueError(empty_msg)
 
+    # Check length (O(1)) before strip() so oversized input is rejected without a copy
     if len(topic) > 200:
         msg = "Topic is too long (max 200 chars)."
         raise ValueError(msg)
 
+    if not topic.strip():
+        raise ValueError(empty_msg)
+
     # Allow alphanumeric, spaces, - _ . : ,
     if not re.match(r"^[a-zA-Z0-9\s\-_\.,:]+$", topic):
         logger.warning(f"Topic contains special characters: {topic}")
@@ -101,14 +113,21 @@ def _process_page_selection(
     page_items: list[LeanCanvas], page_size: int, ui_config: UIConfig
 ) -> LeanCanvas | None | str:
     """Handle user input for a single page."""
+    # Render the whole page into one buffer so it is emitted with a single write
+    echo("\n".join(_IDEA_TEMPLATE.format(item) for item in page_items))
+
+    # Index the CURRENT page once; the first idea with a given id wins
+    page_index: dict[int, LeanCanvas] = {}
     for item in page_items:
-        echo(f"\n[{item.id}] {item.title}")
-        echo(f"    Problem: {item.problem}")
-        echo(f"    Solution: {item.solution}")
-        echo("-" * 50)
+        page_index.setdefault(item.id, item)
+
+    # Bind prompt strings once; the retry loop below can spin on bad input
+    select_prompt = ui_config.select_prompt
+    id_not_found = ui_config.id_not_found
+    invalid_input = ui_config.invalid_input
 
     while True:
-        choice = safe_input(ui_config.select_prompt)
+        choice = safe_input(select_prompt)
 
         if not choice:
             continue
@@ -123,26 +142,29 @@ def _process_page_selection(
         try:
             idx = int(choice)
             # Search in CURRENT page only
-            selected = next((i for i in page_items if i.id == idx), None)
+            selected = page_index.get(idx)
 
             if selected:
                 return selected
 
-            echo(ui_config.id_not_found.format(idx=idx))
+            echo(id_not_found.format(idx=idx))
         except ValueError:
-            echo(ui_config.invalid_input)
+            echo(invalid_input)
 
     return None
 
 
 def browse_and_select(
-    ideas_gen: Iterator[LeanCanvas], page_size: int | None = None
+    ideas_gen: Iterator[LeanCanvas],
+    page_size: int | None = None,
+    ui_config: UIConfig | None = None,
 ) -> LeanCanvas | None:
     """
     Browse items from generator in chunks (pages) and allow selection.
     Strictly O(page_size) memory usage.
     """
-    ui_config = get_settings().ui
+    if ui_config is None:
+        ui_config = get_settings().ui
     if page_size is None:
         page_size = ui_config.page_size
 
@@ -152,14 +174,13 @@ def browse_and_select(
         page_size = 5
 
     # Peek to handle empty generator
-    try:
-        first_item = next(ideas_gen)
-    except StopIteration:
+    first_item = next(ideas_gen, None)
+    if first_item is None:
         echo(ui_config.no_ideas)
         return None
 
     # Put first item back into a new iterator
-    current_iter = chain([first_item], ideas_gen)
+    current_iter = _prepend(first_item, ideas_gen)
 
     echo(ui_config.generated_header)
 
@@ -185,51 +206,75 @@ def browse_and_select(
     return None
 
 
-def _process_execution(topic: str) -> Iterator[LeanCanvas]:
+def _stream_generated_ideas(app: Any, initial_state: GlobalState) -> Any:
+    """
+    Return the ideator's generated_ideas as soon as the graph emits them.
+
+    Streams node updates instead of waiting for invoke() to return the final state,
+    and stops pulling from the graph once the ideator update has been seen.
+    """
+    for update in app.stream(initial_state, stream_mode="updates"):
+        node_output = update.get("ideator")
+        if isinstance(node_output, dict):
+            return node_output.get("generated_ideas")
+    return None
+
+
+def _process_execution(topic: str, ui_config: UIConfig | None = None) -> Iterator[LeanCanvas]:
     """Execute the ideation workflow."""
-    ui_config = get_settings().ui
-    echo(ui_config.phase_start.format(phase=Phase.IDEATION))
-    echo(ui_config.researching.format(topic=topic))
-    echo(ui_config.wait)
+    # Deferred: the LangGraph stack is only needed once a topic is actually run
+    from src.core.graph import create_app
+
+    if ui_config is None:
+        ui_config = get_settings().ui
+    echo(
+        "\n".join(
+            (
+                ui_config.phase_start.format(phase=Phase.IDEATION),
+                ui_config.researching.format(topic=topic),
+                ui_config.wait,
+            )
+        )
+    )
 
     app = create_app()
-    initial_state = GlobalState(topic=topic)
-    final_state = app.invoke(initial_state)
-
-    generated_ideas_raw = final_state.get("generated_ideas", [])
+    generated_ideas_raw = _stream_generated_ideas(app, GlobalState(topic=topic))
 
     if generated_ideas_raw is None:
         return
 
-    # Normalize to iterator and STRICTLY enforce iterator type
-    # We strictly expect an iterator or convert to one without loading into list first
+    # Normalize to iterator without loading into list first;
+    # iter() returns generators unchanged and wraps lists and other iterables
     if isinstance(generated_ideas_raw, list):
         logger.warning(
             "generated_ideas was materialized as a list. Memory usage optimization missed."
         )
-        iterator = iter(generated_ideas_raw)
-    elif isinstance(generated_ideas_raw, Iterator):
-        iterator = generated_ideas_raw
-    else:
-        # Fallback for other iterables
-        iterator = iter(generated_ideas_raw)
-
-    # We yield items one by one to ensure this function remains a generator
-    for item in iterator:
-        if isinstance(item, LeanCanvas):
-            yield item
-        elif isinstance(item, dict):
+    iterator = iter(generated_ideas_raw)
+
+    # We yield items one by one to ensure this function remains a generator.
+    # Ready-made canvases skip validation via an exact type check; everything else
+    # is validated. Tracebacks are only rendered at DEBUG; failures are summarised once.
+    failed = 0
+    try:
+        for item in iterator:
+            if type(item) is LeanCanvas:
+                yield item
+                continue
             try:
-                yield LeanCanvas(**item)
+                yield LeanCanvas.model_validate(item)
             except Exception:
-                logger.exception("Failed to parse idea")
-                continue
-        else:
-            logger.warning(f"Unknown item type in generated ideas: {type(item)}")
+                failed += 1
+                logger.debug("Failed to parse idea", exc_info=True)
+    finally:
+        if failed:
+            logger.warning(f"Skipped {failed} generated idea(s) that failed validation.")
 
 
 def run_simulation_mode(topic: str, selected_idea: LeanCanvas) -> None:
     """Run the simulation phase with UI."""
+    from src.core.simulation import create_simulation_graph
+    from src.ui.renderer import SimulationRenderer
+
     initial_state = GlobalState(
         topic=topic, selected_idea=selected_idea, simulation_active=True, phase=Phase.IDEATION
     )
@@ -237,8 +282,18 @@ def run_simulation_mode(topic: str, selected_idea: LeanCanvas) -> None:
     app = create_simulation_graph()
 
     # Shared state container
-    # We use a dict to hold the current state reference
-    shared_state = {"current": initial_state}
+    # A single-slot list holds the current state reference
+    shared_state: list[GlobalState] = [initial_state]
+    state_lock = threading.Lock()
+
+    def publish(new_state: GlobalState) -> None:
+        # States are fully built before publishing; only the swap is guarded
+        with state_lock:
+            shared_state[0] = new_state
+
+    def current_state() -> GlobalState:
+        with state_lock:
+            return shared_state[0]
 
     def background_task() -> None:
         try:
@@ -247,12 +302,11 @@ def run_simulation_mode(topic: str, selected_idea: LeanCanvas) -> None:
             for state_update in app.stream(initial_state, stream_mode="values"):
                 if isinstance(state_update, dict):
                     try:
-                        # Update shared state safely
-                        shared_state["current"] = GlobalState(**state_update)
+                        publish(GlobalState.model_validate(state_update))
                     except Exception:
                         logger.exception("Failed to convert state update to GlobalState")
                 elif isinstance(state_update, GlobalState):
-                    shared_state["current"] = state_update
+                    publish(state_update)
                 else:
                     logger.warning(f"Unknown state update type: {type(state_update)}")
 
@@ -268,7 +322,7 @@ def run_simulation_mode(topic: str, selected_idea: LeanCanvas) -> None:
 
     try:
         # Start UI (Blocking)
-        renderer = SimulationRenderer(lambda: shared_state["current"])
+        renderer = SimulationRenderer(current_state)
         renderer.start()
     finally:
         # Ensure cleanup if possible, though daemon thread dies with main
@@ -277,19 +331,45 @@ def run_simulation_mode(topic: str, selected_idea: LeanCanvas) -> None:
         pass
 
 
+def _read_transcript_chunks(path: Path, chunk_size: int, max_length: int) -> Iterator[str]:
+    """
+    Yield a transcript in chunk_size pieces so it is never held as a single string.
+    Applies the same document length cap RAG enforces on whole-string input.
+    """
+    total = 0
+    with path.open(encoding="utf-8") as f:
+        while chunk := f.read(chunk_size):
+            total += len(chunk)
+            if total > max_length:
+                msg = ERR_RAG_TEXT_TOO_LARGE
+                raise ValueError(msg)
+            yield chunk
+
+
 def ingest_transcript(filepath: str) -> None:
     """Ingest a transcript file into the RAG engine."""
+    from src.data.rag import RAG
+
     try:
         echo(f"Ingesting transcript from {filepath}...")
 
         # Security: Validate filepath
         path = validate_filepath(filepath)
 
-        with path.open(encoding="utf-8") as f:
-            content = f.read()
+        settings = get_settings()
+        chunk_size = settings.rag_chunk_size
+        max_length = settings.rag_max_document_length
+
+        # A file never has more characters than bytes, so only one larger than the cap
+        # needs a counting pass; it runs before RAG embeds any batch of the transcript
+        if path.stat().st_size > max_length:
+            for _ in _read_transcript_chunks(path, chunk_size, max_length):
+                pass
+
+        chunks = _read_transcript_chunks(path, chunk_size, max_length)
 
         rag = RAG()
-        rag.ingest_text(content, source=str(path))
+        rag.ingest_text(chunks, source=str(path))
         rag.persist_index()
         echo(f"Successfully ingested {filepath} into vector store.")
     except Exception as e:
@@ -297,12 +377,23 @@ def ingest_transcript(filepath: str) -> None:
         echo(f"Error ingesting file: {e}")
 
 
+def _topic_arg(value: str) -> str:
+    """argparse type hook: validate a topic given on the command line."""
+    try:
+        return validate_topic(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
+
+
+# CLI parser, built once at import so repeated main() calls reuse it
+_PARSER = argparse.ArgumentParser(description="JTC 2.0")
+_PARSER.add_argument("topic", nargs="?", help="Business topic", type=_topic_arg)
+_PARSER.add_argument("--ingest", help="Path to transcript file to ingest", type=str)
+
+
 def main() -> None:
     """CLI Entry Point."""
-    parser = argparse.ArgumentParser(description="JTC 2.0")
-    parser.add_argument("topic", nargs="?", help="Business topic")
-    parser.add_argument("--ingest", help="Path to transcript file to ingest", type=str)
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
 
     ui_config = get_settings().ui
     echo("=== JTC 2.0 ===")
@@ -312,18 +403,19 @@ def main() -> None:
         return
 
     try:
+        # Command-line topics are already validated by the parser
         topic = args.topic
         if not topic:
-            topic = safe_input("Enter a business topic (e.g., 'AI for Agriculture'): ")
-
-        # Security: Validate topic
-        topic = validate_topic(topic)
+            # Security: Validate topic
+            topic = validate_topic(
+                safe_input("Enter a business topic (e.g., 'AI for Agriculture'): ")
+            )
 
         # STRICT SCALABILITY: typed_ideas_gen is a generator.
         # We pass it directly to the browse function without converting to list.
-        typed_ideas_gen = _process_execution(topic)
+        typed_ideas_gen = _process_execution(topic, ui_config)
 
-        selected_idea = browse_and_select(typed_ideas_gen)
+        selected_idea = browse_and_select(typed_ideas_gen, ui_config=ui_config)
 
         if selected_idea:
             echo(ui_config.selected.format(title=selected_idea.title))
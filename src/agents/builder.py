@@ -1,19 +1,29 @@
+import hashlib
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import Any
 
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from src.agents.base import BaseAgent
-from src.core.config import get_settings
+from src.core.config import Settings, get_settings
 from src.domain_models.agent_spec import AgentPromptSpec
 from src.domain_models.experiment import ExperimentPlan
 from src.domain_models.state import GlobalState
 
 logger = logging.getLogger(__name__)
 
+# Generated specs keyed by a digest of the model name and compiled context.
+# Process-level, because AgentFactory builds a fresh agent for every graph node call.
+_SPEC_CACHE: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_SPEC_CACHE_MAX = 32
+
 
 class BuilderAgent(BaseAgent):
     """
@@ -25,7 +35,32 @@ class BuilderAgent(BaseAgent):
 
     def __init__(self, llm: ChatOpenAI) -> None:
         self.llm = llm
-        self.settings = get_settings()
+        # Prompt | structured-output chains, built on first use and reused by this agent's
+        # tenacity retries; AgentFactory builds a new agent (and new chains) per node call
+        self._chains: dict[type[BaseModel], Runnable[dict[str, Any], Any]] = {}
+
+    @cached_property
+    def settings(self) -> Settings:
+        """Application settings, resolved on first access rather than per construction."""
+        return get_settings()
+
+    def _get_chain(
+        self, schema: type[BaseModel], sys_msg: str, error_feedback: str = ""
+    ) -> Runnable[dict[str, Any], Any]:
+        """Returns the prompt | structured-output chain for a schema, cached per agent."""
+        if error_feedback:
+            # Feedback changes the system prompt, so that chain is built fresh
+            sys_msg += f"\n\nPREVIOUS ERROR TO FIX:\n{error_feedback}"
+        elif schema in self._chains:
+            return self._chains[schema]
+
+        prompt = ChatPromptTemplate.from_messages(
+            [("system", sys_msg), ("user", "Context:\n{context}")]
+        )
+        chain = prompt | self.llm.with_structured_output(schema)
+        if not error_feedback:
+            self._chains[schema] = chain
+        return chain
 
     def _compile_context(self, state: GlobalState) -> str:
         """Compiles prior domain models into a single string for the LLM."""
@@ -62,24 +97,13 @@ class BuilderAgent(BaseAgent):
             "Using the provided context, generate the ultimate Markdown prompt spec for AI coders (like Cursor/Windsurf). "
             "You must apply 'subtraction thinking' to remove unnecessary features."
         )
-        if error_feedback:
-            sys_msg += f"\n\nPREVIOUS ERROR TO FIX:\n{error_feedback}"
-
-        prompt = ChatPromptTemplate.from_messages(
-            [("system", sys_msg), ("user", "Context:\n{context}")]
-        )
-
-        chain = prompt | self.llm.with_structured_output(AgentPromptSpec)
+        chain = self._get_chain(AgentPromptSpec, sys_msg, error_feedback)
         try:
             result = chain.invoke({"context": context})
             if isinstance(result, AgentPromptSpec):
                 return result
-<<<<<<< HEAD
             msg = f"Expected AgentPromptSpec, got {type(result)}"
             raise ValueError(msg)
-=======
-            raise ValueError(f"Expected AgentPromptSpec, got {type(result)}")
->>>>>>> dbf79509e5301d6b0cbef8dc6782ab30464bee9e
         except ValidationError as e:
             logger.warning(f"Validation error generating AgentPromptSpec. Retrying... Details: {e}")
             raise
@@ -96,24 +120,13 @@ class BuilderAgent(BaseAgent):
             "You are a growth hacker. Generate an Experiment Plan to test the riskiest assumption of this MVP. "
             "Define the acquisition channel, AARRR metrics targets, and the pivot condition."
         )
-        if error_feedback:
-            sys_msg += f"\n\nPREVIOUS ERROR TO FIX:\n{error_feedback}"
-
-        prompt = ChatPromptTemplate.from_messages(
-            [("system", sys_msg), ("user", "Context:\n{context}")]
-        )
-
-        chain = prompt | self.llm.with_structured_output(ExperimentPlan)
+        chain = self._get_chain(ExperimentPlan, sys_msg, error_feedback)
         try:
             result = chain.invoke({"context": context})
             if isinstance(result, ExperimentPlan):
                 return result
-<<<<<<< HEAD
             msg = f"Expected ExperimentPlan, got {type(result)}"
             raise ValueError(msg)
-=======
-            raise ValueError(f"Expected ExperimentPlan, got {type(result)}")
->>>>>>> dbf79509e5301d6b0cbef8dc6782ab30464bee9e
         except ValidationError as e:
             logger.warning(f"Validation error generating ExperimentPlan. Retrying... Details: {e}")
             raise
@@ -129,21 +142,29 @@ class BuilderAgent(BaseAgent):
             logger.warning("No context available to generate specs.")
             return {}
 
+        model_name = getattr(self.llm, "model_name", "")
+        cache_key = hashlib.blake2b(f"{model_name}\n{context}".encode(), digest_size=16).hexdigest()
+        cached = _SPEC_CACHE.get(cache_key)
+        if cached is not None:
+            _SPEC_CACHE.move_to_end(cache_key)
+            logger.info("Reusing specs generated for identical context.")
+            return dict(cached)
+
         try:
-            agent_prompt_spec = self._generate_agent_prompt_spec(context)
-            experiment_plan = self._generate_experiment_plan(context)
-<<<<<<< HEAD
+            # Both specs only read the compiled context, so the two LLM round trips
+            # are issued concurrently instead of back to back
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                spec_future = executor.submit(self._generate_agent_prompt_spec, context)
+                plan_future = executor.submit(self._generate_experiment_plan, context)
+                agent_prompt_spec = spec_future.result()
+                experiment_plan = plan_future.result()
         except Exception:
             logger.exception("BuilderAgent run failed during spec generation.")
             return {}
         else:
             logger.info("Successfully generated AgentPromptSpec and ExperimentPlan.")
-            return {"agent_prompt_spec": agent_prompt_spec, "experiment_plan": experiment_plan}
-=======
-
-            logger.info("Successfully generated AgentPromptSpec and ExperimentPlan.")
-            return {"agent_prompt_spec": agent_prompt_spec, "experiment_plan": experiment_plan}
-        except Exception:
-            logger.exception("BuilderAgent run failed during spec generation.")
-            return {}
->>>>>>> dbf79509e5301d6b0cbef8dc6782ab30464bee9e
+            result = {"agent_prompt_spec": agent_prompt_spec, "experiment_plan": experiment_plan}
+            _SPEC_CACHE[cache_key] = dict(result)
+            if len(_SPEC_CACHE) > _SPEC_CACHE_MAX:
+                _SPEC_CACHE.popitem(last=False)
+            return result
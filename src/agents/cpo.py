@@ -1,5 +1,7 @@
 import logging
+import os
 import time
+from pathlib import Path
 from typing import Any
 
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -14,6 +16,15 @@ from src.domain_models.state import GlobalState
 logger = logging.getLogger(__name__)
 
 
+def _support_status(support: float) -> str:
+    """Label a stakeholder's initial support level."""
+    if support > 0.7:
+        return "Supportive"
+    if support < 0.3:
+        return "Resistant"
+    return "Neutral"
+
+
 class CPOAgent(PersonaAgent):
     """
     The Chief Product Officer (CPO) Agent.
@@ -44,9 +55,6 @@ class CPOAgent(PersonaAgent):
         actual_rag_path = rag_path or self.settings.rag_persist_dir
 
         # Security: Validate RAG path against allowed config securely
-        import os
-        from pathlib import Path
-
         is_allowed = False
         # Resolve to absolute path to fully resolve any ../ or symlinks
         abs_actual = str(Path(actual_rag_path).resolve())
@@ -111,20 +119,14 @@ class CPOAgent(PersonaAgent):
 
             # 3. Inject Nemawashi (Influence) Data
             if state.influence_network:
-                stakeholders_info = ["\nSTAKEHOLDER ANALYSIS (Nemawashi):"]
-                for s in state.influence_network.stakeholders:
-                    status = (
-                        "Supportive"
-                        if s.initial_support > 0.7
-                        else "Resistant"
-                        if s.initial_support < 0.3
-                        else "Neutral"
-                    )
-                    stakeholders_info.append(
-                        f"- {s.name}: {status} (Support={s.initial_support:.2f}, Stubbornness={s.stubbornness:.2f})"
-                    )
-
-                research_data += "\n".join(stakeholders_info)
+                stakeholder_lines = [
+                    f"- {s.name}: {_support_status(s.initial_support)} "
+                    f"(Support={s.initial_support:.2f}, Stubbornness={s.stubbornness:.2f})"
+                    for s in state.influence_network.stakeholders
+                ]
+                research_data += "\n".join(
+                    ["\nSTAKEHOLDER ANALYSIS (Nemawashi):", *stakeholder_lines]
+                )
 
             # 4. Inject Value Proposition Canvas and Alternative Analysis
             if state.vpc:
@@ -154,5 +156,5 @@ class CPOAgent(PersonaAgent):
             }
         else:
             # Construct new history
-            new_history = [*list(state.debate_history), message]
+            new_history = [*state.debate_history, message]
             return {"debate_history": new_history}
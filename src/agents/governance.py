@@ -1,74 +1,149 @@
-import json
+import hashlib
 import logging
+import re
+from collections import OrderedDict
+from functools import cached_property
 from typing import Any, TypeVar
 
 from pydantic import BaseModel
 
-from src.agents.base import BaseAgent
-from src.core.config import get_settings
+from src.agents.base import BaseAgent, SearchTool
+from src.core.config import Settings, get_settings
 from src.core.constants import ERR_LLM_RESPONSE_TOO_LARGE
 from src.core.llm import get_llm
 from src.core.metrics import calculate_ltv, calculate_payback_period, calculate_roi
 from src.core.services.file_service import FileService
 from src.domain_models.metrics import FinancialEstimates, Financials, Metrics, RingiSho
 from src.domain_models.state import GlobalState
-from src.tools.search import TavilySearch
+from src.tools.search import get_search_tool
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# Fenced code block LLMs wrap JSON in, with or without a json language tag
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+# Ringi-sho Markdown up to the risks heading; one "- risk" line per risk follows
+_RINGI_TEMPLATE = (
+    "# {title}\n"
+    "\n"
+    "**Status:** {status}\n"
+    "\n"
+    "## Executive Summary\n"
+    "{summary}\n"
+    "\n"
+    "## Financial Projections\n"
+    "- **ROI:** {roi:.2f}x\n"
+    "- **LTV:** ${ltv:.2f}\n"
+    "- **CAC:** ${cac:.2f}\n"
+    "- **Payback:** {payback:.1f} months\n"
+    "\n"
+    "## Risks"
+)
+
+
+# Validated LLM JSON payloads keyed by a digest of the model name and the prompt.
+# Process-level, because AgentFactory builds a fresh agent for every graph node call.
+_RESPONSE_CACHE: OrderedDict[str, str] = OrderedDict()
+_RESPONSE_CACHE_MAX = 128
+
+
+def _utf8_len(text: str) -> int:
+    """UTF-8 byte length of text, skipping the encode for ASCII-only strings."""
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+class _RingiDraft(BaseModel):
+    """LLM-written part of a Ringi-sho; financials and status are filled in locally."""
+
+    title: str
+    executive_summary: str
+    risks: list[str]
+
+
+class _FinancialsAndRingi(BaseModel):
+    """Single-shot response carrying both the estimates and the Ringi-sho draft."""
+
+    financials: FinancialEstimates
+    ringi: _RingiDraft
+
 
 class GovernanceAgent(BaseAgent):
     """
     Agent responsible for Governance and Ringi-sho generation.
     """
 
-    def __init__(self, file_service: FileService | None = None) -> None:
+    def __init__(
+        self, file_service: FileService | None = None, search_tool: SearchTool | None = None
+    ) -> None:
         self.file_service = file_service or FileService()
+        self._injected_search_tool = search_tool
+
+    @cached_property
+    def settings(self) -> Settings:
+        """Application settings, resolved once on first use instead of in every helper."""
+        return get_settings()
+
+    @cached_property
+    def search_tool(self) -> SearchTool:
+        """Injected search client, or the process-wide shared one with a warm HTTP session."""
+        if self._injected_search_tool is not None:
+            return self._injected_search_tool
+        # Same key as AgentFactory and IdeatorAgent, so all agents share one cached client
+        api_key = self.settings.tavily_api_key
+        return get_search_tool(api_key.get_secret_value() if api_key else None)
 
     def run(self, state: GlobalState) -> dict[str, Any]:
         """
         Run the governance check logic.
         """
         logger.info("Governance Agent: Starting analysis...")
-        settings = get_settings()
+        settings = self.settings
 
         # 1. Context & Search
         industry = self._get_industry_context(state)
-        logger.info(f"Searching benchmarks for: {industry}")
-        search = TavilySearch()
+        logger.info("Searching benchmarks for: %s", industry)
         query = settings.governance.search_query_template.format(industry=industry)
-        search_result = search.safe_search(query)
+        search_result = self.search_tool.safe_search(query)
 
         # Limit search result size to prevent Context Window overflow
         # Explicit truncation as per audit requirement
         limit = settings.governance.max_search_result_size
         if len(search_result) > limit:
-            logger.warning(f"Search result truncated to {limit} characters.")
+            logger.warning("Search result truncated to %d characters.", limit)
             search_result = search_result[:limit]
 
-        # 2. Estimate Financials
-        logger.info("Estimating financials using LLM...")
-        financials = self._estimate_financials(industry, search_result)
+        if settings.governance.single_shot:
+            # 2-4. Estimates and Ringi-Sho draft in one LLM round trip
+            logger.info("Estimating financials and drafting Ringi-Sho in one LLM call...")
+            ringi_sho = self._estimate_and_draft(state, industry, search_result)
+            financials = ringi_sho.financial_projection
+        else:
+            # 2. Estimate Financials
+            logger.info("Estimating financials using LLM...")
+            financials = self._estimate_financials(industry, search_result)
 
-        # 3. Determine Status
-        is_viable = financials.roi >= settings.governance.min_roi_threshold
-        approval_status = "Approved" if is_viable else "Rejected"
+            # 3. Determine Status
+            approval_status = self._approval_status(financials)
 
-        # 4. Generate Ringi-Sho Content
-        logger.info(f"Generating Ringi-Sho. Status: {approval_status}")
-        ringi_sho = self._generate_ringi_sho(state, financials, approval_status)
+            # 4. Generate Ringi-Sho Content
+            logger.info("Generating Ringi-Sho. Status: %s", approval_status)
+            ringi_sho = self._generate_ringi_sho(state, financials, approval_status)
 
-        # 5. Save to Disk (Async wrapper)
+        # 5. Save to Disk (inline, or queued on the FileService pool)
         self._save_to_file(ringi_sho)
 
-        # Shut down FileService executor to prevent resource leaks
-        self.file_service.shutdown()
+        # Shut down FileService executor to prevent resource leaks.
+        # The default inline save has already finished; with GOV_SAVE_INLINE=false a
+        # queued write still completes on the worker thread without the node waiting.
+        self.file_service.shutdown(wait=False)
 
         # 6. Update State
-        updated_metrics = state.metrics_data.model_copy() if state.metrics_data else Metrics()
-        updated_metrics.financials = financials
+        # Shallow copy with financials swapped in; the incoming metrics are left untouched
+        updated_metrics = (state.metrics_data or Metrics()).model_copy(
+            update={"financials": financials}
+        )
 
         return {"ringi_sho": ringi_sho, "metrics_data": updated_metrics}
 
@@ -86,7 +161,7 @@ class GovernanceAgent(BaseAgent):
         return industry
 
     def _estimate_financials(self, industry: str, search_result: str) -> Financials:
-        settings = get_settings()
+        settings = self.settings
 
         prompt = (
             f"Context: Startup idea in {industry}.\n"
@@ -105,12 +180,19 @@ class GovernanceAgent(BaseAgent):
             arpu = settings.governance.default_arpu
             churn = settings.governance.default_churn
 
+        return self._build_financials(cac, arpu, churn)
+
+    def _build_financials(self, cac: float, arpu: float, churn: float) -> Financials:
         ltv = calculate_ltv(arpu, churn)
         payback = calculate_payback_period(cac, arpu)
         roi = calculate_roi(ltv, cac)
 
         return Financials(cac=cac, ltv=ltv, payback_months=payback, roi=roi)
 
+    def _approval_status(self, financials: Financials) -> str:
+        is_viable = financials.roi >= self.settings.governance.min_roi_threshold
+        return "Approved" if is_viable else "Rejected"
+
     def _generate_ringi_sho(
         self, state: GlobalState, financials: Financials, status: str
     ) -> RingiSho:
@@ -127,31 +209,72 @@ class GovernanceAgent(BaseAgent):
         )
 
         try:
-            # We use a temporary Pydantic model for parsing the specific Ringi-Sho structure expected from LLM
             # Since RingiSho model requires 'financial_projection', we parse a partial model first
-            class PartialRingi(BaseModel):
-                title: str
-                executive_summary: str
-                risks: list[str]
-
-            partial = self._safe_llm_call(prompt, PartialRingi)
-
-            return RingiSho(
-                title=partial.title,
-                executive_summary=partial.executive_summary,
-                financial_projection=financials,
-                risks=partial.risks,
-                approval_status=status,
-            )
+            partial = self._safe_llm_call(prompt, _RingiDraft)
         except Exception:
             logger.exception("Ringi-Sho generation failed. Using fallback.")
-            return RingiSho(
-                title=f"Proposal for {idea_title}",
-                executive_summary="Auto-generated summary failed.",
-                financial_projection=financials,
-                risks=["Generation Error"],
-                approval_status=status,
+            return self._fallback_ringi(idea_title, financials, status)
+
+        return self._complete_ringi(partial, financials, status)
+
+    def _estimate_and_draft(
+        self, state: GlobalState, industry: str, search_result: str
+    ) -> RingiSho:
+        """
+        Estimate financials and draft the Ringi-sho with a single LLM call.
+        ROI and approval status are still computed locally from the returned estimates.
+        """
+        settings = self.settings
+        idea_title = state.selected_idea.title if state.selected_idea else "Untitled Idea"
+
+        prompt = (
+            f"Context: Startup idea '{idea_title}' in {industry}.\n"
+            f"Search Data: {search_result}\n\n"
+            "Task 1: Estimate conservative financial metrics for a Seed stage startup.\n"
+            "Task 2: Draft a formal approval document (Ringi-sho) for the idea based on them. "
+            f"It is approved only if ROI (LTV / CAC, with LTV = ARPU / churn) is at least "
+            f"{settings.governance.min_roi_threshold:.2f}.\n\n"
+            "Return ONLY a JSON object with keys: "
+            "'financials' (object with 'cac' (float), 'arpu' (float), "
+            "'churn_rate' (float between 0.0 and 1.0)) and "
+            "'ringi' (object with 'title', 'executive_summary' (text), 'risks' (list of strings)).\n"
+            "Do not include markdown formatting or explanations."
+        )
+
+        try:
+            response = self._safe_llm_call(prompt, _FinancialsAndRingi)
+        except Exception:
+            logger.exception("Single-shot governance call failed. Using defaults.")
+            financials = self._build_financials(
+                settings.governance.default_cac,
+                settings.governance.default_arpu,
+                settings.governance.default_churn,
             )
+            return self._fallback_ringi(idea_title, financials, self._approval_status(financials))
+
+        estimates = response.financials
+        financials = self._build_financials(estimates.cac, estimates.arpu, estimates.churn_rate)
+        status = self._approval_status(financials)
+        logger.info("Drafted Ringi-Sho. Status: %s", status)
+        return self._complete_ringi(response.ringi, financials, status)
+
+    def _complete_ringi(self, draft: _RingiDraft, financials: Financials, status: str) -> RingiSho:
+        return RingiSho(
+            title=draft.title,
+            executive_summary=draft.executive_summary,
+            financial_projection=financials,
+            risks=draft.risks,
+            approval_status=status,
+        )
+
+    def _fallback_ringi(self, idea_title: str, financials: Financials, status: str) -> RingiSho:
+        return RingiSho(
+            title=f"Proposal for {idea_title}",
+            executive_summary="Auto-generated summary failed.",
+            financial_projection=financials,
+            risks=["Generation Error"],
+            approval_status=status,
+        )
 
     def _safe_llm_call(self, prompt: str, model_class: type[T]) -> T:
         """
@@ -166,76 +289,76 @@ class GovernanceAgent(BaseAgent):
 
         Raises:
             ValueError: If response is too large.
-            JSONDecodeError: If parsing fails.
-            ValidationError: If schema validation fails.
+            ValidationError: If the response is not valid JSON or fails schema validation.
         """
-        settings = get_settings()
         llm = get_llm()
-
-        content = ""
+        model_name = getattr(llm, "model_name", "")
+        cache_key = hashlib.blake2b(f"{model_name}\n{prompt}".encode(), digest_size=16).hexdigest()
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            _RESPONSE_CACHE.move_to_end(cache_key)
+            logger.info("Reusing LLM response for identical prompt.")
+            return model_class.model_validate_json(cached)
+
+        settings = self.settings
+
+        parts: list[str] = []
+        size = 0
         max_bytes = settings.governance.max_llm_response_size
 
         # Memory Safety: Stream and check incremental size
         # Note: llm.stream() returns an iterator of chunks (AIMessageChunk)
+        # Only each new chunk is measured, rather than the whole response so far
         for chunk in llm.stream(prompt):
             chunk_content = str(chunk.content)
-            content += chunk_content
-            if len(content.encode("utf-8")) > max_bytes:
+            size += _utf8_len(chunk_content)
+            if size > max_bytes:
                 logger.error(ERR_LLM_RESPONSE_TOO_LARGE)
                 raise ValueError(ERR_LLM_RESPONSE_TOO_LARGE)
+            parts.append(chunk_content)
 
-        data_dict = self._parse_json(content)
-        return model_class.model_validate(data_dict)
+        json_text = self._extract_json("".join(parts))
+        result = model_class.model_validate_json(json_text)
+        # Only responses that validated are cached, so failures are retried next time
+        _RESPONSE_CACHE[cache_key] = json_text
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX:
+            _RESPONSE_CACHE.popitem(last=False)
+        return result
 
-    def _parse_json(self, text: str) -> dict[str, Any]:
+    def _extract_json(self, text: str) -> str:
         """
-        Helper to parse JSON from LLM response.
+        Helper to extract the JSON payload from an LLM response.
         Uses regex to extract JSON block for robustness.
-
-        Raises:
-            JSONDecodeError: If parsing fails.
         """
-        import re
-
-        # Try finding JSON block first
-        match = re.search(r"```json\s*(.*?)\s*```", text, re.DOTALL)
+        # A single scan covers both tagged and untagged fences
+        match = _JSON_FENCE.search(text)
         if match:
             text = match.group(1)
-        else:
-            # Fallback: Try finding any code block
-            match = re.search(r"```\s*(.*?)\s*```", text, re.DOTALL)
-            if match:
-                text = match.group(1)
 
         # Strip whitespace
-        text = text.strip()
-        return json.loads(text)  # type: ignore
+        return text.strip()
 
     def _save_to_file(self, ringi: RingiSho) -> None:
         """
         Save Ringi-Sho to file using FileService.
         """
-        settings = get_settings()
-
-        # Optimize string construction
-        lines = [
-            f"# {ringi.title}",
-            "",
-            f"**Status:** {ringi.approval_status}",
-            "",
-            "## Executive Summary",
-            f"{ringi.executive_summary}",
-            "",
-            "## Financial Projections",
-            f"- **ROI:** {ringi.financial_projection.roi:.2f}x",
-            f"- **LTV:** ${ringi.financial_projection.ltv:.2f}",
-            f"- **CAC:** ${ringi.financial_projection.cac:.2f}",
-            f"- **Payback:** {ringi.financial_projection.payback_months:.1f} months",
-            "",
-            "## Risks",
-        ]
-        lines.extend([f"- {risk}" for risk in ringi.risks])
-
-        content = "\n".join(lines)
-
-        self.file_service.save_text_async(content, settings.governance.output_path)
+        settings = self.settings
+
+        financials = ringi.financial_projection
+        content = _RINGI_TEMPLATE.format_map(
+            {
+                "title": ringi.title,
+                "status": ringi.approval_status,
+                "summary": ringi.executive_summary,
+                "roi": financials.roi,
+                "ltv": financials.ltv,
+                "cac": financials.cac,
+                "payback": financials.payback_months,
+            }
+        ) + "".join(f"\n- {risk}" for risk in ringi.risks)
+
+        if settings.governance.save_inline:
+            # A few KB of local Markdown is written faster than a thread hand-off
+            self.file_service.save_text(content, settings.governance.output_path)
+        else:
+            self.file_service.save_text_async(content, settings.governance.output_path)
@@ -1,3 +1,4 @@
+import logging
 from collections.abc import Iterator
 from typing import Any
 
@@ -10,7 +11,9 @@ from src.core.config import Settings, get_settings
 from src.core.constants import ERR_UNIQUE_ID_VIOLATION
 from src.domain_models.lean_canvas import LeanCanvas
 from src.domain_models.state import GlobalState
-from src.tools.search import TavilySearch
+from src.tools.search import get_search_tool
+
+logger = logging.getLogger(__name__)
 
 
 class LeanCanvasList(BaseModel):
@@ -34,6 +37,11 @@ class LeanCanvasList(BaseModel):
         return v
 
 
+# Passed to with_structured_output as a JSON schema rather than the model class, so the
+# response is parsed by JsonOutputParser, which streams progressively completed objects
+_LEAN_CANVAS_LIST_SCHEMA = LeanCanvasList.model_json_schema()
+
+
 class IdeatorAgent(BaseAgent):
     """
     Agent responsible for generating startup ideas based on market research.
@@ -60,8 +68,8 @@ class IdeatorAgent(BaseAgent):
         """
         self.llm = llm
         self.settings = app_settings or get_settings()
-        self.search_tool = search_tool or TavilySearch(
-            api_key=self.settings.tavily_api_key.get_secret_value()
+        self.search_tool = search_tool or get_search_tool(
+            self.settings.tavily_api_key.get_secret_value()
             if self.settings.tavily_api_key
             else None
         )
@@ -89,22 +97,42 @@ class IdeatorAgent(BaseAgent):
 
     def _generate_ideas(self, prompt: ChatPromptTemplate) -> Iterator[LeanCanvas]:
         """
-        Invoke LLM to generate ideas and yield them as an iterator.
+        Stream the LLM response and yield each idea as soon as it is complete.
 
-        Note: Currently waits for full LLM response then yields items.
-        Future optimization: Use streaming parsing if supported.
+        The structured output streams as progressively larger partial objects. A canvas
+        is complete once the next one has started, and the last one when the stream ends,
+        so the first ideas are available long before the full list has been generated.
         """
-        chain = prompt | self.llm.with_structured_output(LeanCanvasList)
+        chain = prompt | self.llm.with_structured_output(_LEAN_CANVAS_LIST_SCHEMA)
+        seen_ids: set[int] = set()
+        canvases: list[Any] = []
+        emitted = 0
         try:
-            result = chain.invoke({})
+            for partial in chain.stream({}):
+                if isinstance(partial, dict) and isinstance(partial.get("canvases"), list):
+                    canvases = partial["canvases"]
+                for raw in canvases[emitted : len(canvases) - 1]:
+                    emitted += 1
+                    yield from self._accept_canvas(raw, seen_ids)
         except Exception:
+            logger.exception("Idea generation stream failed.")
             return
 
-        if not isinstance(result, LeanCanvasList):
-            return
+        for raw in canvases[emitted:]:
+            yield from self._accept_canvas(raw, seen_ids)
 
-        # Yield items one by one to satisfy iterator interface
-        yield from result.canvases
+    def _accept_canvas(self, raw: Any, seen_ids: set[int]) -> Iterator[LeanCanvas]:
+        """Validate one streamed canvas, skipping invalid entries and repeated IDs."""
+        try:
+            canvas = LeanCanvas.model_validate(raw)
+        except Exception:
+            logger.warning("Skipping generated idea that failed validation.")
+            return
+        if canvas.id in seen_ids:
+            logger.warning(f"{ERR_UNIQUE_ID_VIOLATION} Skipping repeated id {canvas.id}.")
+            return
+        seen_ids.add(canvas.id)
+        yield canvas
 
     def run(self, state: GlobalState) -> dict[str, Any]:
         """
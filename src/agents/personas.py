@@ -114,7 +114,7 @@ class PersonaAgent(BaseAgent, RateLimitMixin):
         # but here GlobalState uses list replacement by default in Pydantic.
         # We need to append.
 
-        new_history = [*list(state.debate_history), message]
+        new_history = [*state.debate_history, message]
         return {"debate_history": new_history}
 
 
@@ -319,6 +319,16 @@ class GovernanceConfig(BaseSettings):
         default=5000,
         description="Max chars for search result context",
     )
+    single_shot: bool = Field(
+        alias="GOV_SINGLE_SHOT",
+        default=False,
+        description="Estimate financials and draft the Ringi-sho in a single LLM call",
+    )
+    save_inline: bool = Field(
+        alias="GOV_SAVE_INLINE",
+        default=True,
+        description="Write the Ringi-sho on the calling thread instead of the FileService pool",
+    )
 
     @field_validator("search_query_template")
     @classmethod
@@ -488,6 +498,11 @@ class Settings(BaseSettings):
     search_depth: str = Field(
         alias="SEARCH_DEPTH", default="advanced", description="Search depth (basic/advanced)"
     )
+    search_cache_ttl: int = Field(
+        alias="SEARCH_CACHE_TTL",
+        default=86400,
+        description="Seconds a successful search result is reused (0 disables caching)",
+    )
     search_query_template: str = Field(
         alias="SEARCH_QUERY_TEMPLATE",
         description="Template for search queries",
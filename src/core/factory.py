@@ -41,11 +41,11 @@ class AgentFactory:
         # CPO needs state context, so it's harder to cache globally without state key.
         # But other personas are stateless w.r.t construction.
         if role == Role.CPO:
-            from src.tools.search import TavilySearch
+            from src.tools.search import get_search_tool
 
             llm = get_llm()
             settings = get_settings()
-            search_tool = TavilySearch(api_key=settings.tavily_api_key.get_secret_value())
+            search_tool = get_search_tool(settings.tavily_api_key.get_secret_value())
             rag_path = state.rag_index_path if state else settings.rag_persist_dir
             return CPOAgent(llm, search_tool=search_tool, app_settings=settings, rag_path=rag_path)
 
@@ -57,11 +57,11 @@ class AgentFactory:
         Factory for stateless persona agents.
         No caching to ensure fresh configuration usage (e.g. LLM model changes).
         """
-        from src.tools.search import TavilySearch
+        from src.tools.search import get_search_tool
 
         llm = get_llm()
         settings = get_settings()
-        search_tool = TavilySearch(api_key=settings.tavily_api_key.get_secret_value())
+        search_tool = get_search_tool(settings.tavily_api_key.get_secret_value())
 
         if role == Role.NEW_EMPLOYEE:
             return NewEmployeeAgent(llm, search_tool=search_tool, app_settings=settings)
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from typing import Any
 
 from langgraph.graph import END, StateGraph
@@ -24,11 +25,15 @@ from src.domain_models.state import GlobalState
 logger = logging.getLogger(__name__)
 
 
+@lru_cache
 def create_app() -> CompiledStateGraph[GlobalState, Any, Any]:
     """
     Create and compile the LangGraph application.
 
     This graph implements the "The JTC 2.0" architecture with 4 critical Decision Gates.
+    The compiled graph holds no per-run state, so it is built once per process.
+    Settings read here (e.g. interrupt points) are therefore fixed for the process;
+    call create_app.cache_clear() after changing them.
     """
     workflow = StateGraph(GlobalState)
 
@@ -1,4 +1,7 @@
 import logging
+import typing
+
+import numpy as np
 
 from src.core.config import NemawashiConfig, get_settings
 from src.core.nemawashi.utils import NemawashiUtils
@@ -37,9 +40,9 @@ class ConsensusEngine:
             return []
 
         # Convert opinions to numpy array
-        import numpy as np
-
-        opinions = np.array([s.initial_support for s in network.stakeholders], dtype=float)
+        opinions = np.fromiter(
+            (s.initial_support for s in network.stakeholders), dtype=float, count=n
+        )
 
         # Build Sparse Matrix using shared utility
         matrix_op = NemawashiUtils.build_sparse_matrix(network, n)
@@ -59,7 +62,7 @@ class ConsensusEngine:
 
             if np.allclose(current_ops, next_ops, atol=tolerance):
                 logger.info("Consensus converged.")
-                return list(next_ops)
+                return typing.cast(list[float], next_ops.tolist())
             current_ops = next_ops
 
-        return list(current_ops)
+        return typing.cast(list[float], current_ops.tolist())
@@ -1,4 +1,7 @@
 import logging
+import os
+import stat
+import tempfile
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -11,6 +14,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Mode a plain open() would give a new file. The umask can only be read by setting it,
+# so it is read once at import rather than racing other threads on every save.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
+
 
 class FileService:
     """
@@ -63,15 +72,9 @@ class FileService:
 
         return target_path
 
-<<<<<<< HEAD
     def save_pdf_sync(  # noqa: C901
         self, state: "GlobalState", base_dir: Path, filename: str = "Final_Artifacts_Canvas.pdf"
     ) -> None:
-=======
-    def save_pdf_sync(
-        self, state: "GlobalState", base_dir: Path, filename: str = "Final_Artifacts_Canvas.pdf"
-    ) -> None:  # noqa: C901
->>>>>>> dbf79509e5301d6b0cbef8dc6782ab30464bee9e
         """
         Generates the Final Artifact Canvas PDF from GlobalState.
         Includes robust path validation and uses fpdf2 for secure rendering.
@@ -143,28 +146,75 @@ class FileService:
         """
         Save text to a file asynchronously using a thread pool.
         This prevents blocking the main event loop during file I/O.
+        Path validation runs on the worker too, so the caller only enqueues the job.
 
         Args:
             content: The string content to write.
             path: The destination file path.
         """
         try:
-            valid_path = self._validate_path(path)
-            self._executor.submit(self._save_text_sync, content, valid_path)
+            self._executor.submit(self._validate_and_save, content, path)
         except Exception:
             logger.exception("Failed to schedule file save")
 
+    def save_text(self, content: str, path: str | Path) -> None:
+        """
+        Save text to a file on the calling thread.
+        Suited to small local files, where a thread pool dispatch costs more than the write.
+
+        Args:
+            content: The string content to write.
+            path: The destination file path.
+        """
+        self._validate_and_save(content, path)
+
+    def _validate_and_save(self, content: str, path: str | Path) -> None:
+        """Validate the destination path, then write; failures are logged, not raised."""
+        try:
+            valid_path = self._validate_path(path)
+        except Exception:
+            logger.exception("Failed to validate file save path")
+            return
+        self._save_text_sync(content, valid_path)
+
+    def _write_atomic(self, content: str, path: Path) -> None:
+        """
+        Write to a uniquely named sibling, then rename it over the target so readers
+        never observe a partially written file and overlapping saves do not collide.
+        The temporary file is removed if the write or rename fails. The target keeps its
+        existing mode (or gets the umask default), not the owner-only mode of a temp file.
+        """
+        tmp = tempfile.NamedTemporaryFile(  # noqa: SIM115
+            "w",
+            encoding="utf-8",
+            dir=path.parent,
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+            delete=False,
+        )
+        tmp_path = Path(tmp.name)
+        try:
+            with tmp:
+                tmp.write(content)
+            mode = stat.S_IMODE(path.stat().st_mode) if path.exists() else _NEW_FILE_MODE
+            tmp_path.chmod(mode)
+            tmp_path.replace(path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
     def _save_text_sync(self, content: str, path: Path) -> None:
         """
         Synchronous implementation of save text.
         Includes simple retry logic for robustness.
+        The file is replaced atomically via a temporary sibling file.
         """
         attempts = 3
         for attempt in range(attempts):
             try:
                 # Ensure parent exists
                 path.parent.mkdir(parents=True, exist_ok=True)
-                path.write_text(content, encoding="utf-8")
+                self._write_atomic(content, path)
                 logger.info(f"File saved successfully to {path}")
                 break
             except PermissionError:
@@ -6,6 +6,7 @@ The sequence is loaded from configuration to allow flexibility.
 """
 
 import logging
+from functools import lru_cache
 
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
@@ -18,10 +19,14 @@ from src.domain_models.state import GlobalState
 logger = logging.getLogger(__name__)
 
 
+@lru_cache
 def create_simulation_graph() -> CompiledStateGraph:  # type: ignore[type-arg]
     """
     Create the simulation sub-graph based on configured turn sequence.
     Dynamically builds nodes and edges from Settings.
+    Cached, since every simulation round would otherwise rebuild and recompile it.
+    The turn sequence is therefore fixed for the process; call
+    create_simulation_graph.cache_clear() after changing it.
     """
     settings = get_settings()
 
@@ -1,6 +1,3 @@
-from .search import TavilySearch
-<<<<<<< HEAD
+from .search import TavilySearch, get_search_tool
 
-__all__ = ["TavilySearch"]
-=======
->>>>>>> dbf79509e5301d6b0cbef8dc6782ab30464bee9e
+__all__ = ["TavilySearch", "get_search_tool"]
@@ -1,4 +1,7 @@
 import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Literal
 
 from tavily import InvalidAPIKeyError, MissingAPIKeyError, TavilyClient
@@ -17,6 +20,13 @@ from src.core.constants import ERR_SEARCH_CONFIG_MISSING, ERR_SEARCH_FAILED
 
 logger = logging.getLogger(__name__)
 
+# Successful search results shared across TavilySearch instances, least recently used first:
+# normalized query -> (monotonic timestamp, formatted result)
+_SEARCH_CACHE: OrderedDict[str, tuple[float, str]] = OrderedDict()
+_SEARCH_CACHE_MAX = 256
+
+_NO_RESULTS = "No results found."
+
 
 class TavilySearch:
     """Wrapper for Tavily Search API with retry logic."""
@@ -72,7 +82,7 @@ class TavilySearch:
 
         results = response.get("results", [])
         if not results:
-            return "No results found."
+            return _NO_RESULTS
 
         # Use generator expression within join for memory efficiency during string construction
         return "\n".join(
@@ -83,12 +93,45 @@ class TavilySearch:
         )
 
     def safe_search(self, query: str) -> str:
-        """Execute a search safely, catching exceptions."""
+        """
+        Execute a search safely, catching exceptions.
+        Successful results are reused for repeat queries within the configured TTL.
+        """
+        ttl = get_settings().search_cache_ttl
+        key = query.strip().lower()
+        cached = _SEARCH_CACHE.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < ttl:
+                _SEARCH_CACHE.move_to_end(key)
+                logger.info("Reusing cached search result for: %s", query)
+                return cached[1]
+            # Expired entries are dropped rather than left to accumulate
+            del _SEARCH_CACHE[key]
+
         try:
-            return self.search(query)
+            result = self.search(query)
         except (MissingAPIKeyError, InvalidAPIKeyError, ValueError):
             logger.exception("Tavily search failed: Invalid Configuration/Auth")
             return ERR_SEARCH_FAILED
         except Exception:
             logger.exception("Tavily search failed after retries")
             return ERR_SEARCH_FAILED
+        else:
+            # An empty answer may be transient, so it is not pinned for the whole TTL
+            if ttl > 0 and result != _NO_RESULTS:
+                _SEARCH_CACHE[key] = (time.monotonic(), result)
+                if len(_SEARCH_CACHE) > _SEARCH_CACHE_MAX:
+                    _SEARCH_CACHE.popitem(last=False)
+            return result
+
+
+@lru_cache(maxsize=4)
+def get_search_tool(api_key: str | None = None) -> TavilySearch:
+    """
+    Factory to get a shared search client per API key.
+    Cached so agents rebuilt on every graph run reuse one HTTP session.
+
+    Args:
+        api_key: Optional API key override. Defaults to config settings.
+    """
+    return TavilySearch(api_key=api_key)
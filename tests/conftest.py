@@ -58,6 +58,27 @@ def _patch_env() -> Generator[None, None, None]:
         yield
 
 
+@pytest.fixture(autouse=True)
+def _clear_response_caches() -> Generator[None, None, None]:
+    """Start every test with empty process-level caches so test order cannot matter."""
+    from src.agents import builder, governance
+    from src.core.graph import create_app
+    from src.core.simulation import create_simulation_graph
+    from src.tools import search
+
+    def clear() -> None:
+        builder._SPEC_CACHE.clear()
+        governance._RESPONSE_CACHE.clear()
+        search._SEARCH_CACHE.clear()
+        search.get_search_tool.cache_clear()
+        create_app.cache_clear()
+        create_simulation_graph.cache_clear()
+
+    clear()
+    yield
+    clear()
+
+
 @pytest.fixture
 def mock_llm_factory() -> MagicMock:
     return MagicMock()
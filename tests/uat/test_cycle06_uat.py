@@ -1,9 +1,3 @@
-<<<<<<< HEAD
-=======
-from src.domain_models.agent_spec import AgentPromptSpec, StateMachine
-from src.domain_models.sitemap import UserStory
-from src.domain_models.experiment import ExperimentPlan, MetricTarget
->>>>>>> dbf79509e5301d6b0cbef8dc6782ab30464bee9e
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,10 +7,7 @@ from src.domain_models.agent_spec import AgentPromptSpec, StateMachine
 from src.domain_models.experiment import ExperimentPlan, MetricTarget
 from src.domain_models.lean_canvas import LeanCanvas
 from src.domain_models.metrics import Metrics, RingiSho
-<<<<<<< HEAD
 from src.domain_models.sitemap import UserStory
-=======
->>>>>>> dbf79509e5301d6b0cbef8dc6782ab30464bee9e
 from src.domain_models.state import GlobalState
 
 
@@ -76,8 +67,8 @@ class TestCycle06UAT:
         expected_roi = expected_ltv / mock_cac  # 0.8
 
         # Mock dependencies
-        with patch("src.agents.governance.TavilySearch") as mock_search_cls:
-            mock_search = mock_search_cls.return_value
+        with patch("src.agents.governance.get_search_tool") as mock_get_search_tool:
+            mock_search = mock_get_search_tool.return_value
             mock_search.safe_search.return_value = "Search result"
 
             with (
@@ -136,8 +127,8 @@ class TestCycle06UAT:
         expected_ltv = mock_arpu / mock_churn  # 5000.0
         expected_roi = expected_ltv / mock_cac  # 8.33...
 
-        with patch("src.agents.governance.TavilySearch") as mock_search_cls:
-            mock_search = mock_search_cls.return_value
+        with patch("src.agents.governance.get_search_tool") as mock_get_search_tool:
+            mock_search = mock_get_search_tool.return_value
             mock_search.safe_search.return_value = "Search result"
 
             with (
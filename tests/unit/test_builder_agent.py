@@ -1,8 +1,10 @@
+import threading
 from collections.abc import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.agents import builder
 from src.agents.builder import BuilderAgent
 from src.domain_models.agent_spec import AgentPromptSpec, StateMachine
 from src.domain_models.experiment import ExperimentPlan, MetricTarget
@@ -19,31 +21,37 @@ def mock_llm() -> Generator[MagicMock, None, None]:
 
 @pytest.fixture
 def agent(mock_llm: MagicMock) -> BuilderAgent:
-<<<<<<< HEAD
     with patch("src.agents.builder.get_settings"):
-=======
-    with patch("src.agents.builder.get_settings") as mock_settings:
->>>>>>> dbf79509e5301d6b0cbef8dc6782ab30464bee9e
         return BuilderAgent(llm=mock_llm)
 
 
+def _idea(title: str) -> LeanCanvas:
+    return LeanCanvas(
+        id=1,
+        title=title,
+        problem="Prob is a big problem",
+        customer_segments="Seg",
+        unique_value_prop="Val is a great prop",
+        solution="Sol is the best solution",
+        status="draft",
+    )
+
+
 @pytest.fixture
 def state_with_context() -> GlobalState:
-    return GlobalState(
-        topic="Testing",
-        selected_idea=LeanCanvas(
-            id=1,
-            title="App title",
-            problem="Prob is a big problem",
-            customer_segments="Seg",
-            unique_value_prop="Val is a great prop",
-            solution="Sol is the best solution",
-            status="draft",
-        ),
-    )
+    return GlobalState(topic="Testing", selected_idea=_idea("App title"))
 
 
 class TestBuilderAgent:
+    def test_settings_resolved_lazily(self, mock_llm: MagicMock) -> None:
+        """Test settings are loaded on first access, not at construction."""
+        with patch("src.agents.builder.get_settings") as mock_get_settings:
+            agent = BuilderAgent(llm=mock_llm)
+            mock_get_settings.assert_not_called()
+
+            assert agent.settings is agent.settings
+            mock_get_settings.assert_called_once()
+
     def test_compile_context_with_idea(
         self, agent: BuilderAgent, state_with_context: GlobalState
     ) -> None:
@@ -82,14 +90,10 @@ class TestBuilderAgent:
         mock_chain.invoke.return_value = expected_spec
         mock_prompt_tmpl.__or__.return_value = mock_chain
 
-<<<<<<< HEAD
         # Create a mock object, not mocking the method itself which type checkers dislike
         mock_llm_structured = MagicMock()
         mock_llm_structured.return_value = mock_chain
         agent.llm.with_structured_output = mock_llm_structured  # type: ignore
-=======
-        agent.llm.with_structured_output.return_value = mock_chain
->>>>>>> dbf79509e5301d6b0cbef8dc6782ab30464bee9e
 
         result = agent._generate_agent_prompt_spec("Context")
         assert result == expected_spec
@@ -116,17 +120,32 @@ class TestBuilderAgent:
         mock_chain.invoke.return_value = expected_plan
         mock_prompt_tmpl.__or__.return_value = mock_chain
 
-<<<<<<< HEAD
         mock_llm_structured = MagicMock()
         mock_llm_structured.return_value = mock_chain
         agent.llm.with_structured_output = mock_llm_structured  # type: ignore
-=======
-        agent.llm.with_structured_output.return_value = mock_chain
->>>>>>> dbf79509e5301d6b0cbef8dc6782ab30464bee9e
 
         result = agent._generate_experiment_plan("Context")
         assert result == expected_plan
 
+    @patch("src.agents.builder.ChatPromptTemplate.from_messages")
+    def test_generate_reuses_cached_chain(
+        self, mock_prompt: MagicMock, agent: BuilderAgent
+    ) -> None:
+        """Test the prompt and structured-output chain are built once per schema."""
+        expected_plan = MagicMock(spec=ExperimentPlan)
+        mock_chain = MagicMock()
+        mock_chain.invoke.return_value = expected_plan
+        mock_prompt.return_value.__or__.return_value = mock_chain
+        mock_llm_structured = MagicMock()
+        agent.llm.with_structured_output = mock_llm_structured  # type: ignore
+
+        assert agent._generate_experiment_plan("Context A") is expected_plan
+        assert agent._generate_experiment_plan("Context B") is expected_plan
+
+        mock_prompt.assert_called_once()
+        mock_llm_structured.assert_called_once_with(ExperimentPlan)
+        assert mock_chain.invoke.call_count == 2
+
     def test_run_empty_context(self, agent: BuilderAgent) -> None:
         """Test run aborts if there's no context available."""
         state = GlobalState(topic="test")
@@ -165,8 +184,70 @@ class TestBuilderAgent:
                 "experiment_plan": expected_plan,
             }
 
+    def test_run_reuses_specs_for_same_context(
+        self, mock_llm: MagicMock, state_with_context: GlobalState
+    ) -> None:
+        """Test repeated runs on identical context skip the LLM calls, even on a new agent."""
+        spec = MagicMock(spec=AgentPromptSpec)
+        plan = MagicMock(spec=ExperimentPlan)
+
+        with (
+            patch.object(
+                BuilderAgent, "_generate_agent_prompt_spec", return_value=spec
+            ) as mock_spec,
+            patch.object(BuilderAgent, "_generate_experiment_plan", return_value=plan) as mock_plan,
+        ):
+            # AgentFactory builds a new agent per node call, so the cache must outlive it
+            first = BuilderAgent(llm=mock_llm).run(state_with_context)
+            second = BuilderAgent(llm=mock_llm).run(state_with_context)
+
+        assert first == second == {"agent_prompt_spec": spec, "experiment_plan": plan}
+        mock_spec.assert_called_once()
+        mock_plan.assert_called_once()
+
+    def test_spec_cache_is_bounded(self, agent: BuilderAgent) -> None:
+        """Test the oldest cached specs are evicted once the cache is full."""
+        spec = MagicMock(spec=AgentPromptSpec)
+        plan = MagicMock(spec=ExperimentPlan)
+
+        with (
+            patch("src.agents.builder._SPEC_CACHE_MAX", 2),
+            patch.object(agent, "_generate_agent_prompt_spec", return_value=spec) as mock_spec,
+            patch.object(agent, "_generate_experiment_plan", return_value=plan),
+        ):
+            for topic in ("a", "b", "c", "a"):
+                agent.run(GlobalState(topic=topic, selected_idea=_idea(f"App title {topic}")))
+            assert len(builder._SPEC_CACHE) == 2
+
+        assert mock_spec.call_count == 4
+
     def test_run_exception(self, agent: BuilderAgent, state_with_context: GlobalState) -> None:
         """Test run catches exceptions safely."""
         with patch.object(agent, "_generate_agent_prompt_spec", side_effect=Exception("Failed")):
             result = agent.run(state_with_context)
             assert result == {}
+
+    def test_run_generates_specs_concurrently(
+        self, agent: BuilderAgent, state_with_context: GlobalState
+    ) -> None:
+        """Test both specs are requested in parallel rather than sequentially."""
+        # Each call waits for the other one to start; sequential calls would time out
+        barrier = threading.Barrier(2, timeout=5)
+        spec = MagicMock(spec=AgentPromptSpec)
+        plan = MagicMock(spec=ExperimentPlan)
+
+        def generate_spec(context: str) -> AgentPromptSpec:
+            barrier.wait()
+            return spec
+
+        def generate_plan(context: str) -> ExperimentPlan:
+            barrier.wait()
+            return plan
+
+        with (
+            patch.object(agent, "_generate_agent_prompt_spec", side_effect=generate_spec),
+            patch.object(agent, "_generate_experiment_plan", side_effect=generate_plan),
+        ):
+            result = agent.run(state_with_context)
+
+        assert result == {"agent_prompt_spec": spec, "experiment_plan": plan}
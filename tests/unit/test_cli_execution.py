@@ -0,0 +1,126 @@
+import logging
+import time
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from main import _process_execution, run_simulation_mode
+from src.core.config import UIConfig
+from src.domain_models.lean_canvas import LeanCanvas
+from src.domain_models.state import GlobalState
+
+
+def _idea_dict(idx: int) -> dict[str, Any]:
+    return {
+        "id": idx,
+        "title": f"Idea {idx}",
+        "problem": "Problem is valid valid",
+        "customer_segments": "Seg",
+        "unique_value_prop": "UVP is valid valid",
+        "solution": "Solution is valid valid",
+    }
+
+
+def _run_with_ideas(ideas: Any) -> list[LeanCanvas]:
+    with patch("src.core.graph.create_app") as mock_create_app:
+        mock_create_app.return_value.stream.return_value = iter(
+            [{"ideator": {"generated_ideas": ideas}}, {"__interrupt__": ()}]
+        )
+        return list(_process_execution("Topic", ui_config=UIConfig()))
+
+
+@patch("main.echo")
+def test_process_execution_passes_through_canvases(mock_echo: MagicMock) -> None:
+    """LeanCanvas items are yielded as-is."""
+    canvases = [LeanCanvas(**_idea_dict(i)) for i in range(3)]
+
+    result = _run_with_ideas(iter(canvases))
+
+    assert result == canvases
+
+
+@patch("main.echo")
+def test_process_execution_parses_dicts_and_skips_invalid(
+    mock_echo: MagicMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Dict items are validated into LeanCanvas; invalid entries are skipped."""
+    invalid = _idea_dict(1)
+    invalid["title"] = "x"
+
+    with caplog.at_level(logging.WARNING, logger="main"):
+        result = _run_with_ideas(iter([_idea_dict(0), invalid, _idea_dict(2), "not a dict"]))
+
+    assert [idea.id for idea in result] == [0, 2]
+    assert all(isinstance(idea, LeanCanvas) for idea in result)
+    # Failures are summarised in a single warning without tracebacks
+    skipped = [r for r in caplog.records if "Skipped" in r.getMessage()]
+    assert len(skipped) == 1
+    assert "Skipped 2" in skipped[0].getMessage()
+    assert all(r.exc_info is None for r in caplog.records)
+
+
+@patch("main.echo")
+def test_process_execution_validates_items_after_a_canvas(mock_echo: MagicMock) -> None:
+    """A leading LeanCanvas does not let later raw items bypass validation."""
+    invalid = _idea_dict(2)
+    invalid["title"] = "x"
+
+    result = _run_with_ideas(iter([LeanCanvas(**_idea_dict(0)), _idea_dict(1), invalid]))
+
+    assert [idea.id for idea in result] == [0, 1]
+    assert all(isinstance(idea, LeanCanvas) for idea in result)
+
+
+@patch("main.echo")
+def test_process_execution_empty(mock_echo: MagicMock) -> None:
+    """Empty or missing results yield nothing."""
+    assert _run_with_ideas([]) == []
+    assert _run_with_ideas(None) == []
+
+
+@patch("main.echo")
+def test_process_execution_stops_streaming_at_ideator_update(mock_echo: MagicMock) -> None:
+    """Graph updates after the ideator output are not pulled from the stream."""
+    consumed: list[str] = []
+
+    def updates() -> Any:
+        consumed.append("ideator")
+        yield {"ideator": {"generated_ideas": iter([_idea_dict(0)])}}
+        consumed.append("after")
+        yield {"__interrupt__": ()}
+
+    with patch("src.core.graph.create_app") as mock_create_app:
+        mock_create_app.return_value.stream.return_value = updates()
+        result = list(_process_execution("Topic", ui_config=UIConfig()))
+
+    assert [idea.id for idea in result] == [0]
+    assert consumed == ["ideator"]
+    mock_create_app.return_value.stream.assert_called_once()
+    assert mock_create_app.return_value.stream.call_args.kwargs == {"stream_mode": "updates"}
+
+
+@patch("src.ui.renderer.SimulationRenderer")
+def test_run_simulation_mode_publishes_streamed_states(mock_renderer_cls: MagicMock) -> None:
+    """States streamed by the simulation thread become visible to the renderer."""
+    idea = LeanCanvas(**_idea_dict(0))
+    final_state = GlobalState(topic="Done", selected_idea=idea)
+    seen: list[GlobalState] = []
+
+    def start() -> None:
+        getter = mock_renderer_cls.call_args.args[0]
+        deadline = time.monotonic() + 5
+        while getter().topic != "Done" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        seen.append(getter())
+
+    mock_renderer_cls.return_value.start.side_effect = start
+
+    with patch("src.core.simulation.create_simulation_graph") as mock_create:
+        mock_create.return_value.stream.return_value = iter(
+            [final_state.model_dump(), "unexpected"]
+        )
+        run_simulation_mode("Topic", idea)
+
+    assert len(seen) == 1
+    assert seen[0].topic == "Done"
@@ -0,0 +1,96 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from main import _read_transcript_chunks, ingest_transcript
+
+
+def test_read_transcript_chunks_streams_file(tmp_path: Path) -> None:
+    """Transcript is yielded in fixed-size pieces that rebuild the original text."""
+    transcript = tmp_path / "interview.txt"
+    transcript.write_text("顧客インタビュー " * 20, encoding="utf-8")
+
+    chunks = list(_read_transcript_chunks(transcript, chunk_size=16, max_length=1000))
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 16 for chunk in chunks)
+    assert "".join(chunks) == transcript.read_text(encoding="utf-8")
+
+
+def test_read_transcript_chunks_enforces_max_length(tmp_path: Path) -> None:
+    """Oversized transcripts are rejected while streaming."""
+    transcript = tmp_path / "interview.txt"
+    transcript.write_text("x" * 100, encoding="utf-8")
+
+    with pytest.raises(ValueError, match="too large"):
+        list(_read_transcript_chunks(transcript, chunk_size=16, max_length=50))
+
+
+@patch("main.echo")
+@patch("src.data.rag.RAG")
+def test_ingest_transcript_passes_chunk_iterator(
+    mock_rag_cls: MagicMock,
+    mock_echo: MagicMock,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """ingest_transcript hands RAG a lazy iterator instead of the whole file."""
+    monkeypatch.chdir(tmp_path)
+    transcript = tmp_path / "interview.txt"
+    transcript.write_text("Customer said the onboarding is slow.", encoding="utf-8")
+    received: list[str] = []
+    mock_rag_cls.return_value.ingest_text.side_effect = lambda text, source: received.extend(text)
+
+    ingest_transcript("interview.txt")
+
+    text_arg = mock_rag_cls.return_value.ingest_text.call_args.args[0]
+    assert not isinstance(text_arg, str)
+    assert "".join(received) == "Customer said the onboarding is slow."
+    mock_rag_cls.return_value.persist_index.assert_called_once()
+
+
+@patch("main.echo")
+@patch("src.data.rag.RAG")
+def test_ingest_transcript_rejects_oversized_file_before_rag(
+    mock_rag_cls: MagicMock,
+    mock_echo: MagicMock,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """An over-long transcript is rejected before RAG embeds any of it."""
+    monkeypatch.chdir(tmp_path)
+    transcript = tmp_path / "interview.txt"
+    transcript.write_text("x" * 100, encoding="utf-8")
+
+    with patch("main.get_settings") as mock_get_settings:
+        mock_get_settings.return_value.rag_chunk_size = 16
+        mock_get_settings.return_value.rag_max_document_length = 50
+        ingest_transcript("interview.txt")
+
+    mock_rag_cls.assert_not_called()
+    assert "too large" in mock_echo.call_args.args[0]
+
+
+@patch("main.echo")
+@patch("src.data.rag.RAG")
+def test_ingest_transcript_counts_characters_not_bytes(
+    mock_rag_cls: MagicMock,
+    mock_echo: MagicMock,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A multi-byte transcript over the cap in bytes but not in characters is ingested."""
+    monkeypatch.chdir(tmp_path)
+    transcript = tmp_path / "interview.txt"
+    transcript.write_text("顧" * 40, encoding="utf-8")
+    received: list[str] = []
+    mock_rag_cls.return_value.ingest_text.side_effect = lambda text, source: received.extend(text)
+
+    with patch("main.get_settings") as mock_get_settings:
+        mock_get_settings.return_value.rag_chunk_size = 16
+        mock_get_settings.return_value.rag_max_document_length = 50
+        ingest_transcript("interview.txt")
+
+    assert "".join(received) == "顧" * 40
+    mock_rag_cls.return_value.persist_index.assert_called_once()
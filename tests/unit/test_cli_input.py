@@ -1,6 +1,8 @@
 from unittest.mock import patch
 
-from main import safe_input
+import pytest
+
+from main import _PARSER, safe_input, validate_topic
 
 
 def test_safe_input_basic() -> None:
@@ -20,3 +22,25 @@ def test_safe_input_keyboard_interrupt() -> None:
     with patch("builtins.input", side_effect=KeyboardInterrupt), patch("sys.exit") as mock_exit:
         safe_input("prompt")
         mock_exit.assert_called_with(0)
+
+
+def test_validate_topic_rejects_oversized_before_strip() -> None:
+    """Oversized input is rejected by length, even if it is only whitespace."""
+    with pytest.raises(ValueError, match="too long"):
+        validate_topic(" " * 10_000)
+
+
+def test_validate_topic_rejects_empty() -> None:
+    """Empty and whitespace-only topics are rejected."""
+    for topic in ("", "   "):
+        with pytest.raises(ValueError, match="empty"):
+            validate_topic(topic)
+
+
+def test_parser_validates_topic_argument() -> None:
+    """Command-line topics are sanitized by the parser and invalid ones exit early."""
+    args = _PARSER.parse_args(["AI for Agriculture!"])
+    assert args.topic == "AI for Agriculture"
+
+    with patch("sys.stderr"), pytest.raises(SystemExit):
+        _PARSER.parse_args(["x" * 300])
@@ -45,3 +45,61 @@ def test_browse_and_select_lazy(
     # Verify echo calls to ensure we saw expected output
     # Just check call count or basic structure
     assert mock_echo.call_count > 0
+
+
+@patch("main.input")
+@patch("main.echo")
+def test_page_rendered_in_single_write(mock_echo: MagicMock, mock_input: MagicMock) -> None:
+    """Each page of ideas should be emitted with a single echo call."""
+    from main import _process_page_selection
+
+    items = [
+        LeanCanvas(
+            id=i,
+            title=f"Idea {i}",
+            problem="Problem is valid valid",
+            customer_segments="Seg",
+            unique_value_prop="UVP is valid valid",
+            solution="Solution is valid valid",
+        )
+        for i in range(2)
+    ]
+    mock_input.return_value = "1"
+
+    result = _process_page_selection(items, page_size=2, ui_config=MagicMock())
+
+    assert result is items[1]
+    assert mock_echo.call_count == 1
+    page_text = mock_echo.call_args[0][0]
+    assert "[0] Idea 0" in page_text
+    assert "[1] Idea 1" in page_text
+
+
+@patch("main.input")
+@patch("main.echo")
+def test_duplicate_ids_do_not_end_browsing_early(
+    mock_echo: MagicMock, mock_input: MagicMock
+) -> None:
+    """A full page with repeated ids is not mistaken for the last page."""
+    ideas = [
+        LeanCanvas(
+            id=i,
+            title=f"Idea {n}",
+            problem="Problem is valid valid",
+            customer_segments="Seg",
+            unique_value_prop="UVP is valid valid",
+            solution="Solution is valid valid",
+        )
+        for n, i in enumerate([0, 0, 1, 2, 3, 4, 5])
+    ]
+    # Page 1 holds ids 0, 0, 1: "0" picks the first duplicate and "n" must advance
+    mock_input.side_effect = ["0"]
+
+    first = browse_and_select(iter(ideas), page_size=3, ui_config=MagicMock())
+    assert first is ideas[0]
+
+    mock_input.side_effect = ["n", "3"]
+    result = browse_and_select(iter(ideas), page_size=3, ui_config=MagicMock())
+
+    assert result is not None
+    assert result.id == 3
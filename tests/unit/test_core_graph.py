@@ -37,6 +37,11 @@ def mock_state() -> GlobalState:
     )
 
 
+def test_create_app_is_built_once() -> None:
+    """Test that the compiled application graph is reused across calls."""
+    assert create_app() is create_app()
+
+
 def test_create_app_structure() -> None:
     """Test that the main application graph is created correctly."""
     app = create_app()
@@ -2,7 +2,9 @@ from unittest.mock import MagicMock, patch
 
 from src.agents.cpo import CPOAgent
 from src.core.config import get_settings
+from src.domain_models.politics import InfluenceNetwork, Stakeholder
 from src.domain_models.simulation import Role
+from src.domain_models.state import GlobalState
 
 
 @patch("src.agents.cpo.RAG")
@@ -25,3 +27,30 @@ def test_cpo_research(mock_llm: MagicMock, mock_rag: MagicMock) -> None:
     result = agent._cached_research("SaaS Platform")
     assert result == "Found customer data"
     agent.rag.query.assert_called()
+
+
+@patch("src.agents.cpo.RAG")
+@patch("src.agents.cpo.BaseChatModel")
+def test_cpo_run_summarises_stakeholders(mock_llm: MagicMock, mock_rag: MagicMock) -> None:
+    agent = CPOAgent(llm=mock_llm, search_tool=MagicMock(), app_settings=get_settings())
+    network = InfluenceNetwork(
+        stakeholders=[
+            Stakeholder(name="CFO", initial_support=0.9, stubbornness=0.5),
+            Stakeholder(name="Legal", initial_support=0.1, stubbornness=0.8),
+            Stakeholder(name="Sales", initial_support=0.5, stubbornness=0.2),
+        ],
+        matrix=[[0.5, 0.25, 0.25], [0.25, 0.5, 0.25], [0.25, 0.25, 0.5]],
+    )
+    state = GlobalState(topic="Test", influence_network=network)
+
+    with patch.object(agent, "_generate_response", return_value="Advice") as mock_generate:
+        result = agent.run(state)
+
+    research_data = mock_generate.call_args.args[1]
+    assert research_data == (
+        "\nSTAKEHOLDER ANALYSIS (Nemawashi):\n"
+        "- CFO: Supportive (Support=0.90, Stubbornness=0.50)\n"
+        "- Legal: Resistant (Support=0.10, Stubbornness=0.80)\n"
+        "- Sales: Neutral (Support=0.50, Stubbornness=0.20)"
+    )
+    assert result["debate_history"][-1].content == "Advice"
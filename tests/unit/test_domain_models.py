@@ -75,6 +75,20 @@ def test_lean_canvas_short_content() -> None:
         )
 
 
+def test_lean_canvas_is_immutable() -> None:
+    """Test LeanCanvas rejects attribute assignment once created."""
+    canvas = LeanCanvas(
+        id=1,
+        title="Test Idea",
+        problem="Test Problem Problem",
+        customer_segments="Test Segment",
+        unique_value_prop="Test UVP UVP UVP",
+        solution="Test Solution Solution",
+    )
+    with pytest.raises(ValidationError):
+        canvas.title = "Changed"  # type: ignore[misc]
+
+
 def test_global_state_defaults() -> None:
     """Test GlobalState default values."""
     state = GlobalState()
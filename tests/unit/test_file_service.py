@@ -1,3 +1,7 @@
+import os
+import stat
+import threading
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,13 +17,12 @@ class TestFileService:
         return FileService()
 
     @patch("src.core.services.file_service.FileService._validate_path")
-    @patch("src.core.services.file_service.Path")
     def test_save_text_async_success(
-        self, mock_path: MagicMock, mock_validate: MagicMock, file_service: FileService
+        self, mock_validate: MagicMock, file_service: FileService, tmp_path: Path
     ) -> None:
-        mock_validate.return_value = mock_path.return_value
-        mock_validate.return_value.__str__.return_value = "protected.md"
         """Verify save_text_async writes content correctly."""
+        target = tmp_path / "test.md"
+        mock_validate.return_value = target
 
         # Call the method
         file_service.save_text_async("content", "test.md")
@@ -29,42 +32,143 @@ class TestFileService:
 
         # Assertions
         mock_validate.assert_called_with("test.md")
-        mock_validate.return_value.write_text.assert_called_with("content", encoding="utf-8")
+        assert target.read_text(encoding="utf-8") == "content"
 
+    @patch("src.core.services.file_service.tempfile.NamedTemporaryFile")
     @patch("src.core.services.file_service.FileService._validate_path")
-    @patch("src.core.services.file_service.Path")
     def test_save_text_async_permission_error(
         self,
-        mock_path: MagicMock,
         mock_validate: MagicMock,
+        mock_tmp_file: MagicMock,
         file_service: FileService,
+        tmp_path: Path,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         """Verify handling of PermissionError."""
-        mock_validate.return_value = mock_path.return_value
-        mock_validate.return_value.__str__.return_value = "protected.md"
-        mock_validate.return_value.write_text.side_effect = PermissionError("Access denied")
+        target = tmp_path / "protected.md"
+        mock_validate.return_value = target
+        mock_tmp_file.side_effect = PermissionError("Access denied")
 
         file_service.save_text_async("content", "protected.md")
         file_service._executor.shutdown(wait=True)
 
-        assert "Permission denied writing to protected.md" in caplog.text
+        assert f"Permission denied writing to {target}" in caplog.text
+        mock_tmp_file.assert_called_once()
 
+    @patch("src.core.services.file_service.tempfile.NamedTemporaryFile")
     @patch("src.core.services.file_service.FileService._validate_path")
-    @patch("src.core.services.file_service.Path")
     def test_save_text_async_os_error(
         self,
-        mock_path: MagicMock,
         mock_validate: MagicMock,
+        mock_tmp_file: MagicMock,
         file_service: FileService,
+        tmp_path: Path,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         """Verify handling of generic OSError."""
-        mock_validate.return_value = mock_path.return_value
-        mock_validate.return_value.__str__.return_value = "file.md"
-        mock_validate.return_value.write_text.side_effect = OSError("Disk full")
+        target = tmp_path / "file.md"
+        mock_validate.return_value = target
+        mock_tmp_file.side_effect = OSError("Disk full")
 
         file_service.save_text_async("content", "file.md")
         file_service._executor.shutdown(wait=True)
 
-        assert "OS error writing to file.md" in caplog.text
+        assert f"OS error writing to {target}" in caplog.text
+        assert mock_tmp_file.call_count == 3
+
+    @patch("src.core.services.file_service.FileService._validate_path")
+    def test_failed_replace_removes_temporary_file(
+        self, mock_validate: MagicMock, file_service: FileService, tmp_path: Path
+    ) -> None:
+        """Verify a failed write leaves neither a temporary file nor a changed target."""
+        target = tmp_path / "out.md"
+        target.write_text("old", encoding="utf-8")
+        mock_validate.return_value = target
+
+        with patch.object(Path, "replace", side_effect=OSError("Disk full")):
+            file_service.save_text("new", "out.md")
+
+        assert target.read_text(encoding="utf-8") == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.md"]
+
+    def test_overlapping_saves_use_distinct_temporary_files(
+        self, file_service: FileService, tmp_path: Path
+    ) -> None:
+        """Verify each save to one path goes through its own uniquely named temporary file."""
+        target = tmp_path / "out.md"
+        tmp_names: list[str] = []
+        real_replace = Path.replace
+
+        def record_replace(self: Path, dest: Path) -> Path:
+            tmp_names.append(self.name)
+            return real_replace(self, dest)
+
+        with patch.object(Path, "replace", record_replace):
+            file_service._write_atomic("first", target)
+            file_service._write_atomic("second", target)
+
+        assert len(set(tmp_names)) == 2
+        assert target.read_text(encoding="utf-8") == "second"
+
+    @patch("src.core.services.file_service.FileService._validate_path")
+    def test_save_keeps_target_file_mode(
+        self, mock_validate: MagicMock, file_service: FileService, tmp_path: Path
+    ) -> None:
+        """Verify an existing file keeps its mode and a new one gets the umask default."""
+        existing = tmp_path / "shared.md"
+        existing.write_text("old", encoding="utf-8")
+        existing.chmod(0o640)
+        mock_validate.return_value = existing
+
+        file_service.save_text("new", "shared.md")
+
+        assert stat.S_IMODE(existing.stat().st_mode) == 0o640
+
+        created = tmp_path / "created.md"
+        mock_validate.return_value = created
+        umask = os.umask(0)
+        os.umask(umask)
+
+        file_service.save_text("new", "created.md")
+
+        assert stat.S_IMODE(created.stat().st_mode) == 0o666 & ~umask
+
+    def test_save_text_async_replaces_file_atomically(
+        self, file_service: FileService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify the target is replaced in full and no temporary file is left behind."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "out.md").write_text("old", encoding="utf-8")
+
+        file_service.save_text_async("new content", "out.md")
+        file_service._executor.shutdown(wait=True)
+
+        assert (tmp_path / "out.md").read_text(encoding="utf-8") == "new content"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.md"]
+
+    def test_save_text_writes_on_calling_thread(
+        self, file_service: FileService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify save_text writes before returning, without using the executor."""
+        monkeypatch.chdir(tmp_path)
+
+        with patch.object(file_service._executor, "submit") as mock_submit:
+            file_service.save_text("content", "inline.md")
+
+        mock_submit.assert_not_called()
+        assert (tmp_path / "inline.md").read_text(encoding="utf-8") == "content"
+
+    def test_save_text_async_validates_on_worker_thread(self, file_service: FileService) -> None:
+        """Verify the caller only enqueues; path validation happens on the worker."""
+        validated_on: list[threading.Thread] = []
+
+        def record_thread(path: str) -> MagicMock:
+            validated_on.append(threading.current_thread())
+            return MagicMock()
+
+        with patch.object(file_service, "_validate_path", side_effect=record_thread):
+            file_service.save_text_async("content", "file.md")
+            file_service._executor.shutdown(wait=True)
+
+        assert len(validated_on) == 1
+        assert validated_on[0] is not threading.current_thread()
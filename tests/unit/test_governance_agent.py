@@ -1,23 +1,19 @@
-from src.domain_models.agent_spec import AgentPromptSpec, StateMachine
-from src.domain_models.sitemap import UserStory
-from src.domain_models.experiment import ExperimentPlan, MetricTarget
-import json
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.agents import governance
 from src.agents.governance import GovernanceAgent
-<<<<<<< HEAD
+from src.core.config import get_settings
+from src.core.services.file_service import FileService
 from src.domain_models.agent_spec import AgentPromptSpec, StateMachine
 from src.domain_models.experiment import ExperimentPlan, MetricTarget
 from src.domain_models.lean_canvas import LeanCanvas
-from src.domain_models.metrics import Metrics
+from src.domain_models.metrics import FinancialEstimates, Financials, Metrics, RingiSho
 from src.domain_models.sitemap import UserStory
-=======
-from src.domain_models.lean_canvas import LeanCanvas
-from src.domain_models.metrics import Metrics, RingiSho
->>>>>>> dbf79509e5301d6b0cbef8dc6782ab30464bee9e
 from src.domain_models.state import GlobalState
+from src.tools.search import get_search_tool
 
 
 class TestGovernanceAgent:
@@ -107,3 +103,248 @@ class TestGovernanceAgent:
 
             assert result.cac == 50.0
             assert result.ltv == 5.0 / 0.1  # 50.0
+
+    @patch("src.agents.governance.get_search_tool")
+    def test_run_shuts_down_file_service_without_waiting(
+        self, mock_get_search_tool: MagicMock
+    ) -> None:
+        """run() saves the Ringi-sho once, then shuts the FileService pool down with wait=False."""
+        file_service = MagicMock()
+        agent = GovernanceAgent(file_service=file_service)
+        mock_get_search_tool.return_value.safe_search.return_value = "data"
+
+        financials = MagicMock()
+        financials.roi = 5.0
+        with (
+            patch.object(agent, "_estimate_financials", return_value=financials),
+            patch.object(agent, "_generate_ringi_sho") as mock_ringi,
+            patch.object(agent, "_save_to_file") as mock_save,
+        ):
+            result = agent.run(GlobalState(topic="Test"))
+
+        mock_save.assert_called_once_with(mock_ringi.return_value)
+        file_service.shutdown.assert_called_once_with(wait=False)
+        assert result["ringi_sho"] is mock_ringi.return_value
+
+    @patch("src.agents.governance.get_search_tool")
+    def test_run_does_not_wait_for_queued_write(self, mock_get_search_tool: MagicMock) -> None:
+        """With save_inline disabled, run() returns while the Ringi-sho write is still pending."""
+        file_service = FileService()
+        agent = GovernanceAgent(file_service=file_service)
+        mock_get_search_tool.return_value.safe_search.return_value = "data"
+        release = threading.Event()
+        written = threading.Event()
+
+        def slow_save(content: str, path: str) -> None:
+            release.wait(timeout=5)
+            written.set()
+
+        financials = Financials(cac=10, ltv=100, payback_months=1, roi=10)
+        ringi = RingiSho(
+            title="Proposal",
+            executive_summary="Summary is long enough for the check.",
+            financial_projection=financials,
+            risks=["Risk 1"],
+            approval_status="Approved",
+        )
+        try:
+            with (
+                patch.object(get_settings().governance, "save_inline", False),
+                patch.object(file_service, "_validate_and_save", side_effect=slow_save),
+                patch.object(agent, "_estimate_financials", return_value=financials),
+                patch.object(agent, "_generate_ringi_sho", return_value=ringi),
+            ):
+                agent.run(GlobalState(topic="Test"))
+                assert not written.is_set()
+        finally:
+            release.set()
+            file_service._executor.shutdown(wait=True)
+
+        assert written.is_set()
+
+    @patch("src.agents.governance.get_llm")
+    def test_safe_llm_call_reuses_response_for_identical_prompt(
+        self, mock_get_llm: MagicMock
+    ) -> None:
+        """A repeated prompt is answered from the cache, even by a freshly built agent."""
+        agent = GovernanceAgent(file_service=MagicMock())
+        chunk = MagicMock()
+        chunk.content = '{"cac": 100.0, "arpu": 10.0, "churn_rate": 0.05}'
+        mock_get_llm.return_value.stream.side_effect = lambda _: iter([chunk])
+
+        first = agent._safe_llm_call("prompt", FinancialEstimates)
+        # AgentFactory builds a new agent per node call, so the cache must outlive it
+        second = GovernanceAgent(file_service=MagicMock())._safe_llm_call(
+            "prompt", FinancialEstimates
+        )
+
+        assert first == second
+        mock_get_llm.return_value.stream.assert_called_once()
+
+        agent._safe_llm_call("other prompt", FinancialEstimates)
+        assert mock_get_llm.return_value.stream.call_count == 2
+
+    @patch("src.agents.governance.get_llm")
+    def test_response_cache_is_keyed_by_model(self, mock_get_llm: MagicMock) -> None:
+        """A reply cached for one model is not handed back after switching models."""
+        agent = GovernanceAgent(file_service=MagicMock())
+        chunk = MagicMock()
+        chunk.content = '{"cac": 100.0, "arpu": 10.0, "churn_rate": 0.05}'
+        mock_get_llm.return_value.stream.side_effect = lambda _: iter([chunk])
+
+        mock_get_llm.return_value.model_name = "gpt-4o"
+        agent._safe_llm_call("prompt", FinancialEstimates)
+        mock_get_llm.return_value.model_name = "gpt-4o-mini"
+        agent._safe_llm_call("prompt", FinancialEstimates)
+
+        assert mock_get_llm.return_value.stream.call_count == 2
+
+    @patch("src.agents.governance.get_llm")
+    def test_response_cache_is_bounded(self, mock_get_llm: MagicMock) -> None:
+        """The oldest cached response is evicted once the cache is full."""
+        agent = GovernanceAgent(file_service=MagicMock())
+        chunk = MagicMock()
+        chunk.content = '{"cac": 100.0, "arpu": 10.0, "churn_rate": 0.05}'
+        mock_get_llm.return_value.stream.side_effect = lambda _: iter([chunk])
+
+        with patch("src.agents.governance._RESPONSE_CACHE_MAX", 2):
+            for prompt in ("a", "b", "c"):
+                agent._safe_llm_call(prompt, FinancialEstimates)
+            assert len(governance._RESPONSE_CACHE) == 2
+
+            agent._safe_llm_call("a", FinancialEstimates)
+
+        assert mock_get_llm.return_value.stream.call_count == 4
+
+    def test_extract_json_strips_code_fences(self) -> None:
+        """JSON is pulled out of tagged or untagged fences and left alone otherwise."""
+        agent = GovernanceAgent(file_service=MagicMock())
+
+        assert agent._extract_json('Here:\n```json\n{"a": 1}\n```') == '{"a": 1}'
+        assert agent._extract_json('```\n{"a": 1}\n```') == '{"a": 1}'
+        assert agent._extract_json('  {"a": 1}\n') == '{"a": 1}'
+
+    @patch("src.agents.governance.get_search_tool")
+    @patch("src.agents.governance.get_llm")
+    def test_single_shot_uses_one_llm_call(
+        self, mock_get_llm: MagicMock, mock_get_search_tool: MagicMock
+    ) -> None:
+        """With single_shot enabled, estimates and draft come from one streamed call."""
+        agent = GovernanceAgent(file_service=MagicMock())
+        mock_get_search_tool.return_value.safe_search.return_value = "data"
+        chunk = MagicMock()
+        # ROI = (10 / 0.05) / 100 = 2.0, below the 3.0 threshold despite the draft's tone
+        chunk.content = (
+            '{"financials": {"cac": 100.0, "arpu": 10.0, "churn_rate": 0.05},'
+            ' "ringi": {"title": "Proposal", "executive_summary": "Looks great.",'
+            ' "risks": ["Churn"]}}'
+        )
+        mock_get_llm.return_value.stream.return_value = iter([chunk])
+
+        with patch.object(get_settings().governance, "single_shot", True):
+            result = agent.run(GlobalState(topic="Test"))
+
+        mock_get_llm.return_value.stream.assert_called_once()
+        ringi = result["ringi_sho"]
+        assert ringi.title == "Proposal"
+        assert ringi.risks == ["Churn"]
+        assert ringi.approval_status == "Rejected"
+        assert ringi.financial_projection.roi == 2.0
+        assert result["metrics_data"].financials == ringi.financial_projection
+
+    def test_settings_resolved_once_on_first_use(self) -> None:
+        """Settings are looked up lazily and then reused by every helper."""
+        with patch("src.agents.governance.get_settings") as mock_get_settings:
+            agent = GovernanceAgent(file_service=MagicMock())
+            mock_get_settings.assert_not_called()
+
+            mock_get_settings.return_value.governance.min_roi_threshold = 3.0
+            financials = agent._build_financials(100.0, 10.0, 0.05)
+            agent._approval_status(financials)
+            agent._approval_status(financials)
+
+        mock_get_settings.assert_called_once()
+
+    def test_save_to_file_writes_inline_by_default(self) -> None:
+        """Small Ringi-sho files skip the thread pool unless save_inline is disabled."""
+        file_service = MagicMock()
+        agent = GovernanceAgent(file_service=file_service)
+        ringi = RingiSho(
+            title="Proposal",
+            executive_summary="Summary is long enough for the check.",
+            financial_projection=Financials(cac=10, ltv=100, payback_months=1, roi=10),
+            risks=["Risk 1"],
+            approval_status="Approved",
+        )
+        output_path = get_settings().governance.output_path
+
+        agent._save_to_file(ringi)
+        file_service.save_text.assert_called_once()
+        content, path = file_service.save_text.call_args.args
+        assert path == output_path
+        assert content == (
+            "# Proposal\n\n**Status:** Approved\n\n"
+            "## Executive Summary\nSummary is long enough for the check.\n\n"
+            "## Financial Projections\n- **ROI:** 10.00x\n- **LTV:** $100.00\n"
+            "- **CAC:** $10.00\n- **Payback:** 1.0 months\n\n## Risks\n- Risk 1"
+        )
+        file_service.save_text_async.assert_not_called()
+
+        with patch.object(get_settings().governance, "save_inline", False):
+            agent._save_to_file(ringi)
+        file_service.save_text_async.assert_called_once()
+
+    @patch("src.tools.search.TavilySearch")
+    def test_search_tool_shared_across_agents(self, mock_tavily_cls: MagicMock) -> None:
+        """Agents rebuilt for every run share one search client."""
+        mock_tavily_cls.return_value.safe_search.return_value = "data"
+
+        financials = MagicMock()
+        financials.roi = 5.0
+        for _ in range(2):
+            agent = GovernanceAgent(file_service=MagicMock())
+            with (
+                patch.object(agent, "_estimate_financials", return_value=financials),
+                patch.object(agent, "_generate_ringi_sho"),
+                patch.object(agent, "_save_to_file"),
+            ):
+                agent.run(GlobalState(topic="Test"))
+
+        mock_tavily_cls.assert_called_once()
+        assert mock_tavily_cls.return_value.safe_search.call_count == 2
+
+    def test_search_tool_shared_with_agent_factory(self) -> None:
+        """Governance reuses the client AgentFactory hands to the persona agents."""
+        key = get_settings().tavily_api_key
+        assert key is not None
+
+        agent = GovernanceAgent(file_service=MagicMock())
+
+        assert agent.search_tool is get_search_tool(key.get_secret_value())
+
+    def test_injected_search_tool_is_used(self) -> None:
+        """An injected search tool replaces the default Tavily client."""
+        search_tool = MagicMock()
+        agent = GovernanceAgent(file_service=MagicMock(), search_tool=search_tool)
+
+        assert agent.search_tool is search_tool
+
+    def test_run_replaces_financials_without_mutating_state(self, mock_state: GlobalState) -> None:
+        """Existing metrics are carried over and only financials are replaced."""
+        agent = GovernanceAgent(file_service=MagicMock(), search_tool=MagicMock())
+        assert mock_state.metrics_data is not None
+        mock_state.metrics_data.custom_metrics = {"nps": 42.0}
+        original_financials = mock_state.metrics_data.financials
+        financials = Financials(cac=10, ltv=100, payback_months=1, roi=10)
+
+        with (
+            patch.object(agent, "_estimate_financials", return_value=financials),
+            patch.object(agent, "_generate_ringi_sho"),
+            patch.object(agent, "_save_to_file"),
+        ):
+            result = agent.run(mock_state)
+
+        updated = result["metrics_data"]
+        assert updated.financials is financials
+        assert updated.custom_metrics == {"nps": 42.0}
+        assert mock_state.metrics_data.financials is original_financials
@@ -46,9 +46,9 @@ class TestGovernanceMemorySafety:
             with pytest.raises(ValueError, match=ERR_LLM_RESPONSE_TOO_LARGE):
                 agent._safe_llm_call("prompt", DummyModel)
 
-    @patch("src.agents.governance.TavilySearch")
+    @patch("src.agents.governance.get_search_tool")
     def test_search_result_truncation(
-        self, mock_search_cls: MagicMock, agent: GovernanceAgent
+        self, mock_get_search_tool: MagicMock, agent: GovernanceAgent
     ) -> None:
         """Verify search results are truncated before processing."""
         settings = get_settings()
@@ -57,7 +57,7 @@ class TestGovernanceMemorySafety:
         # Create a search result larger than the limit
         large_result = "A" * (limit + 1000)
 
-        mock_search = mock_search_cls.return_value
+        mock_search = mock_get_search_tool.return_value
         mock_search.safe_search.return_value = large_result
 
         state = GlobalState(topic="Test")
@@ -81,3 +81,18 @@ class TestGovernanceMemorySafety:
 
             assert len(passed_search_result) == limit
             assert passed_search_result == "A" * limit
+
+    @patch("src.agents.governance.get_llm")
+    def test_safe_llm_call_counts_multibyte_characters(
+        self, mock_llm_factory: MagicMock, agent: GovernanceAgent
+    ) -> None:
+        """Verify the size limit is applied to UTF-8 bytes, not characters."""
+        chunk = MagicMock()
+        chunk.content = "稟議書"  # 3 characters, 9 bytes
+        mock_llm_factory.return_value.stream.return_value = iter([chunk])
+
+        with (
+            patch.object(get_settings().governance, "max_llm_response_size", 8),
+            pytest.raises(ValueError, match=ERR_LLM_RESPONSE_TOO_LARGE),
+        ):
+            agent._safe_llm_call("prompt", DummyModel)
@@ -1,6 +1,8 @@
+from collections.abc import Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
+from langchain_core.runnables import RunnableGenerator
 
 from src.agents.ideator import IdeatorAgent
 from src.domain_models.lean_canvas import LeanCanvas
@@ -13,7 +15,7 @@ def mock_llm() -> MagicMock:
 
 
 @patch("src.agents.ideator.get_settings")
-@patch("src.agents.ideator.TavilySearch")
+@patch("src.agents.ideator.get_search_tool")
 def test_ideator_agent_run_success(
     mock_tavily: MagicMock,
     mock_get_settings: MagicMock,
@@ -37,7 +39,7 @@ def test_ideator_agent_run_success(
 
 
 @patch("src.agents.ideator.get_settings")
-@patch("src.agents.ideator.TavilySearch")
+@patch("src.agents.ideator.get_search_tool")
 def test_ideator_agent_flow(
     mock_tavily: MagicMock,
     mock_get_settings: MagicMock,
@@ -87,7 +89,7 @@ def test_ideator_agent_flow(
 
 
 @patch("src.agents.ideator.get_settings")
-@patch("src.agents.ideator.TavilySearch")
+@patch("src.agents.ideator.get_search_tool")
 def test_ideator_agent_research_logic(
     mock_tavily: MagicMock,
     mock_get_settings: MagicMock,
@@ -106,3 +108,69 @@ def test_ideator_agent_research_logic(
 
     assert res == "Results"
     mock_search.safe_search.assert_called_with("Search AI")
+
+
+def _canvas_dict(idx: int) -> dict[str, object]:
+    return {
+        "id": idx,
+        "title": f"Idea {idx}",
+        "problem": "Problem is valid valid",
+        "customer_segments": "CS",
+        "unique_value_prop": "UVP is valid valid",
+        "solution": "Solution is valid valid",
+    }
+
+
+@patch("src.agents.ideator.get_settings")
+@patch("src.agents.ideator.get_search_tool")
+def test_generate_ideas_yields_canvases_while_streaming(
+    mock_tavily: MagicMock,
+    mock_get_settings: MagicMock,
+    mock_llm: MagicMock,
+) -> None:
+    progress: list[str] = []
+
+    def fake_stream(_: Iterator[object]) -> Iterator[dict[str, object]]:
+        # Partial objects as JsonOutputParser emits them while tokens arrive
+        progress.append("partial-1")
+        yield {"canvases": [{"id": 0, "title": "Idea"}]}
+        progress.append("partial-2")
+        yield {"canvases": [_canvas_dict(0), {"id": 1}]}
+        progress.append("partial-3")
+        yield {"canvases": [_canvas_dict(0), _canvas_dict(0), {"id": 2}]}
+        progress.append("final")
+        yield {"canvases": [_canvas_dict(0), _canvas_dict(0), _canvas_dict(2)]}
+
+    mock_llm.with_structured_output.return_value = RunnableGenerator(fake_stream)
+    agent = IdeatorAgent(llm=mock_llm)
+
+    ideas = agent._generate_ideas(agent._generate_prompt("Topic", "Research"))
+
+    first = next(ideas)
+    assert first.id == 0
+    # The first idea arrives before the rest of the response has been streamed
+    assert progress == ["partial-1", "partial-2"]
+
+    # The repeated id 0 is skipped; the last canvas is emitted once the stream ends
+    assert [idea.id for idea in ideas] == [2]
+    assert progress[-1] == "final"
+
+
+@patch("src.agents.ideator.get_settings")
+@patch("src.agents.ideator.get_search_tool")
+def test_generate_ideas_stops_quietly_on_stream_error(
+    mock_tavily: MagicMock,
+    mock_get_settings: MagicMock,
+    mock_llm: MagicMock,
+) -> None:
+    def failing_stream(_: Iterator[object]) -> Iterator[dict[str, object]]:
+        yield {"canvases": [_canvas_dict(0), {"id": 1}]}
+        msg = "connection dropped"
+        raise RuntimeError(msg)
+
+    mock_llm.with_structured_output.return_value = RunnableGenerator(failing_stream)
+    agent = IdeatorAgent(llm=mock_llm)
+
+    ideas = list(agent._generate_ideas(agent._generate_prompt("Topic", "Research")))
+
+    assert [idea.id for idea in ideas] == [0]
@@ -76,3 +76,5 @@ def test_consensus_calculation() -> None:
 
     assert result[0] > 0.9  # A should converge to B
     assert result[1] == 1.0
+    # Opinions are returned as plain Python floats, not numpy scalars
+    assert all(type(v) is float for v in result)
@@ -3,7 +3,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 from tenacity import RetryError
 
-from src.tools.search import TavilySearch
+from src.core.constants import ERR_SEARCH_FAILED
+from src.tools.search import _SEARCH_CACHE, TavilySearch, get_search_tool
 
 
 @patch("src.tools.search.TavilyClient")
@@ -73,3 +74,109 @@ def test_tavily_safe_search_error(mock_get_settings: MagicMock, mock_client_cls:
     # Updated to match constant ERR_SEARCH_FAILED in Cycle 06
     result = search.safe_search("query")
     assert "Search operation failed" in result
+
+
+@patch.dict("src.tools.search._SEARCH_CACHE", clear=True)
+@patch("src.tools.search.TavilyClient")
+@patch("src.tools.search.get_settings")
+def test_tavily_safe_search_reuses_cached_result(
+    mock_get_settings: MagicMock, mock_client_cls: MagicMock
+) -> None:
+    mock_settings = mock_get_settings.return_value
+    mock_settings.tavily_api_key.get_secret_value.return_value = "test-key"
+    mock_settings.search_cache_ttl = 60
+    mock_client = mock_client_cls.return_value
+    mock_client.search.return_value = {"results": [{"title": "T", "content": "C", "url": "U"}]}
+
+    first = TavilySearch().safe_search("SaaS benchmarks")
+    # A new instance and a differently formatted query still hit the shared cache
+    second = TavilySearch().safe_search("  saas BENCHMARKS ")
+
+    assert first == second
+    assert "Title: T" in first
+    mock_client.search.assert_called_once()
+
+
+@patch.dict("src.tools.search._SEARCH_CACHE", clear=True)
+@patch("src.tools.search.TavilyClient")
+@patch("src.tools.search.get_settings")
+def test_tavily_safe_search_does_not_cache_failures(
+    mock_get_settings: MagicMock, mock_client_cls: MagicMock
+) -> None:
+    mock_settings = mock_get_settings.return_value
+    mock_settings.tavily_api_key.get_secret_value.return_value = "test-key"
+    mock_settings.search_cache_ttl = 60
+    mock_client = mock_client_cls.return_value
+    mock_client.search.side_effect = ValueError("bad request")
+
+    TavilySearch().safe_search("query")
+    TavilySearch().safe_search("query")
+
+    assert mock_client.search.call_count == 2
+
+
+@patch("src.tools.search.time.monotonic")
+@patch("src.tools.search.TavilyClient")
+@patch("src.tools.search.get_settings")
+def test_tavily_safe_search_evicts_expired_result(
+    mock_get_settings: MagicMock, mock_client_cls: MagicMock, mock_monotonic: MagicMock
+) -> None:
+    mock_settings = mock_get_settings.return_value
+    mock_settings.tavily_api_key.get_secret_value.return_value = "test-key"
+    mock_settings.search_cache_ttl = 60
+    mock_client = mock_client_cls.return_value
+    mock_client.search.side_effect = ValueError("bad request")
+    _SEARCH_CACHE["query"] = (0.0, "stale")
+    mock_monotonic.return_value = 61.0
+
+    assert TavilySearch().safe_search("query") == ERR_SEARCH_FAILED
+    assert "query" not in _SEARCH_CACHE
+
+
+@patch("src.tools.search.TavilyClient")
+@patch("src.tools.search.get_settings")
+def test_tavily_safe_search_does_not_cache_empty_results(
+    mock_get_settings: MagicMock, mock_client_cls: MagicMock
+) -> None:
+    mock_settings = mock_get_settings.return_value
+    mock_settings.tavily_api_key.get_secret_value.return_value = "test-key"
+    mock_settings.search_cache_ttl = 60
+    mock_client = mock_client_cls.return_value
+    mock_client.search.return_value = {"results": []}
+
+    TavilySearch().safe_search("query")
+    TavilySearch().safe_search("query")
+
+    assert mock_client.search.call_count == 2
+    assert not _SEARCH_CACHE
+
+
+@patch("src.tools.search._SEARCH_CACHE_MAX", 2)
+@patch("src.tools.search.TavilyClient")
+@patch("src.tools.search.get_settings")
+def test_tavily_safe_search_cache_is_bounded(
+    mock_get_settings: MagicMock, mock_client_cls: MagicMock
+) -> None:
+    mock_settings = mock_get_settings.return_value
+    mock_settings.tavily_api_key.get_secret_value.return_value = "test-key"
+    mock_settings.search_cache_ttl = 60
+    mock_client = mock_client_cls.return_value
+    mock_client.search.return_value = {"results": [{"title": "T", "content": "C", "url": "U"}]}
+
+    search = TavilySearch()
+    for query in ("a", "b", "c"):
+        search.safe_search(query)
+
+    assert list(_SEARCH_CACHE) == ["b", "c"]
+
+
+@patch("src.tools.search.TavilyClient")
+def test_get_search_tool_shares_client_per_key(mock_client_cls: MagicMock) -> None:
+    get_search_tool.cache_clear()
+    try:
+        first = get_search_tool("key-a")
+        assert get_search_tool("key-a") is first
+        assert get_search_tool("key-b") is not first
+        assert mock_client_cls.call_count == 2
+    finally:
+        get_search_tool.cache_clear()